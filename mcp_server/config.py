@@ -30,7 +30,7 @@ class MCPServerConfig:
     
     # Browser settings
     headless_browser: bool = True
-    browser_slow_mo: int = 50
+    browser_slow_mo: int = 0
     
     def __post_init__(self):
         """Initialize default dependencies if not provided."""
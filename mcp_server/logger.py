@@ -1,36 +1,10 @@
 """
 Logger utility for MCP Server.
 
-Simple logging configuration that writes to stderr for MCP STDIO compatibility.
+Re-exports the project logger, which writes to stderr for MCP STDIO
+compatibility, so server and scraper logs share one setup.
 """
 
-import logging
-import sys
+from src.utils.logger import get_logger
 
-
-def get_logger(name: str) -> logging.Logger:
-    """
-    Get a configured logger instance for MCP server.
-    
-    Logs to stderr to avoid corrupting JSON-RPC messages on stdout.
-    
-    Args:
-        name: Name of the logger (typically __name__)
-        
-    Returns:
-        logging.Logger: Configured logger instance
-    """
-    logger = logging.getLogger(name)
-    
-    if not logger.handlers:
-        # Use stderr for MCP STDIO compatibility
-        handler = logging.StreamHandler(sys.stderr)
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-        logger.setLevel(logging.INFO)
-    
-    return logger
+__all__ = ['get_logger']
@@ -29,7 +29,7 @@ def register_scraping_tools(mcp) -> None:
     """
     
     @mcp.tool()
-    async def scrape_google_maps(query: str, max_results: int = None) -> str:
+    async def scrape_google_maps(query: str, max_results: int = None, use_cache: bool = False) -> str:
         """
         Scrape business leads from Google Maps.
         
@@ -40,6 +40,8 @@ def register_scraping_tools(mcp) -> None:
         Args:
             query: Search query (e.g., 'coffee shops in Seattle', 'plumbers in NYC')
             max_results: Maximum number of results to scrape (default: 100, max: 500)
+            use_cache: Return results cached for the same query within the last
+                24 hours instead of scraping again (default: False)
             
         Returns:
             str: JSON string containing:
@@ -80,7 +82,7 @@ def register_scraping_tools(mcp) -> None:
         if max_results is None:
             max_results = DEFAULT_CONFIG.default_scrape_results
         
-        logger.info(f"Scraping tool called: query='{query}', max_results={max_results}")
+        logger.info(f"Scraping tool called: query='{query}', max_results={max_results}, use_cache={use_cache}")
         
         # Validate input
         if not query or not query.strip():
@@ -113,7 +115,8 @@ def register_scraping_tools(mcp) -> None:
             # Execute scraping
             validated_data = scraper.scrape(
                 query=query,
-                max_results=max_results
+                max_results=max_results,
+                use_cache=use_cache
             )
             
             logger.info(f"Successfully scraped {len(validated_data)} businesses")
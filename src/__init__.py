@@ -21,7 +21,7 @@ __all__ = [
     'GoogleMapsScraper',
     'Business',
     'BrowserManager',
-    'DataExtractor',
+    'DataExtractorV3',
     'ValidationService',
     'LeadScoringService',
     'ExportService',
@@ -59,8 +59,35 @@ Examples:
     parser.add_argument(
         '--slow-mo',
         type=int,
-        default=50,
-        help='Delay in milliseconds between browser actions (default: 50)'
+        default=0,
+        help='Delay in milliseconds between browser actions (default: 0)'
+    )
+    
+    parser.add_argument(
+        '--debug-slow-mo',
+        action='store_true',
+        help='Show the browser and slow down every action (250ms) for debugging'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Number of browsers extracting details in parallel (default: 1); '
+             'workers beyond the first always use a fresh profile'
+    )
+    
+    parser.add_argument(
+        '--user-data-dir',
+        type=str,
+        default=None,
+        help='Browser profile directory to reuse between runs (keeps cache and cookies warm)'
+    )
+    
+    parser.add_argument(
+        '--validate-websites',
+        action='store_true',
+        help='Check each website with an HTTP request (slower; default: skipped)'
     )
     
     parser.add_argument(
@@ -111,6 +138,10 @@ def validate_arguments(args: argparse.Namespace) -> bool:
     if args.slow_mo < 0:
         logger.error("slow-mo must be non-negative")
         return False
+    
+    if args.workers is not None and args.workers < 1:
+        logger.error("workers must be at least 1")
+        return False
         
     if not args.query.strip():
         logger.error("query cannot be empty")
@@ -146,14 +177,18 @@ def run_cli() -> int:
     try:
         scraper = GoogleMapsScraper(
             headless=not args.visible,
-            slow_mo=args.slow_mo
+            slow_mo=args.slow_mo,
+            debug=args.debug_slow_mo,
+            workers=args.workers,
+            user_data_dir=args.user_data_dir
         )
         
         output_file = scraper.scrape_and_export(
             query=args.query,
             max_results=args.max_results,
             output_file=args.output,
-            resume=not args.no_resume
+            resume=not args.no_resume,
+            validate_websites=args.validate_websites
         )
         
         if output_file:
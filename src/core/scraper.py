@@ -8,8 +8,9 @@ from src.services.browser_service import BrowserManager
 from src.services.extraction_service_v3 import DataExtractorV3
 from src.services.validation_service import ValidationService
 from src.services.scoring_service import LeadScoringService
-from src.services.export_service import ExportService
+from src.services.export_service import ExportService, BusinessNameIndex
 from src.services.state_service import get_state_manager, ScrapingState
+from src.services.cache_service import get_result_cache
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -18,15 +19,27 @@ logger = get_logger(__name__)
 class GoogleMapsScraper:
     """Main scraper class that orchestrates the scraping workflow."""
     
-    def __init__(self, headless: bool = True, slow_mo: int = 50):
+    def __init__(
+        self,
+        headless: bool = True,
+        slow_mo: int = 0,
+        debug: bool = False,
+        workers: Optional[int] = None,
+        user_data_dir: Optional[str] = None
+    ):
         """
         Initialize the scraper with all required services.
         
         Args:
             headless: Run browser in headless mode
             slow_mo: Slow down operations by specified milliseconds
+            debug: Show the browser and slow it down for a human to watch
+            workers: Pages extracting details in parallel
+                (default: EXTRACTION_CONFIG['concurrency'])
+            user_data_dir: Browser profile directory reused between runs
         """
-        self.browser_manager = BrowserManager(headless, slow_mo)
+        self.workers = workers
+        self.browser_manager = BrowserManager(headless, slow_mo, debug, user_data_dir)
         self.data_extractor = DataExtractorV3(self.browser_manager)
         self.validator = ValidationService()
         self.scorer = LeadScoringService()
@@ -35,7 +48,9 @@ class GoogleMapsScraper:
     def scrape(
         self, 
         query: str, 
-        max_results: int = 100
+        max_results: int = 100,
+        validate_websites: bool = False,
+        use_cache: bool = False
     ) -> List[Dict]:
         """
         Execute the complete scraping workflow.
@@ -43,12 +58,22 @@ class GoogleMapsScraper:
         Args:
             query: Search query for Google Maps
             max_results: Maximum number of results to scrape
+            validate_websites: Check each website with an HTTP request
+            use_cache: Return recent results for the same query without scraping
+                (default: False, always scrape fresh)
             
         Returns:
             list: List of validated and scored business dictionaries
         """
         logger.info(f"Starting scrape for query: {query}")
         results = []
+        extracted = []
+        
+        result_cache = get_result_cache()
+        if use_cache:
+            cached = result_cache.get(query, max_results, validate_websites)
+            if cached is not None:
+                return cached
         
         try:
             self.browser_manager.start()
@@ -65,26 +90,42 @@ class GoogleMapsScraper:
                 return []
             
             # Collect data with callback
-            def collect_business(business_data: Dict):
-                # Validate
-                validated = self.validator.validate_business(business_data)
-                # Score
-                scored = self.scorer.calculate_score(validated)
-                validated['lead_score'] = scored
-                # Add to results
-                results.append(validated)
+            def collect_business(business_data: Optional[Dict], index: int):
+                if business_data is not None:
+                    extracted.append(business_data)
             
             self.data_extractor.extract_from_listings_incremental(
                 max_results, 
-                callback=collect_business
+                callback=collect_business,
+                concurrency=self.workers
             )
             
+            # Validate all results at once so website checks run concurrently
+            results = self.validator.validate_batch(extracted, validate_websites)
+            
+            # Score all results at once
+            self.scorer.score_batch(results)
+            
             logger.info(f"Extracted and processed {len(results)} businesses")
+            
+            if use_cache and results:
+                result_cache.set(query, max_results, results, validate_websites)
+            
             return results
             
         except Exception as e:
             logger.error(f"Error during scraping: {e}", exc_info=True)
-            return results  # Return partial results if any
+            # Return partial results if any, scored like a complete run. Only
+            # the offline phone checks are redone here: website checks may be
+            # what failed, so they are left unknown.
+            partial = results
+            if not partial:
+                try:
+                    partial = self.validator.validate_batch(extracted)
+                except Exception as validation_error:
+                    logger.error(f"Could not validate partial results: {validation_error}")
+                    partial = [{**business, 'website_valid': None} for business in extracted]
+            return self.scorer.score_batch(partial)
         finally:
             self.browser_manager.close()
     
@@ -94,7 +135,8 @@ class GoogleMapsScraper:
         max_results: int = 100,
         output_file: Optional[str] = None,
         export_format: str = 'csv',
-        resume: bool = True
+        resume: bool = True,
+        validate_websites: bool = False
     ) -> Optional[str]:
         """
         Scrape data and export to file with incremental saving and resume support.
@@ -104,20 +146,24 @@ class GoogleMapsScraper:
             query: Search query for Google Maps
             max_results: Maximum number of results to scrape
             output_file: Output filename (auto-generated if None)
-            export_format: Export format ('csv' or 'json')
+            export_format: Export format ('csv', 'json' or 'ndjson')
             resume: Enable resume functionality (default: True)
+            validate_websites: Check each website with an HTTP request
             
         Returns:
             str: Path to exported file, or None if failed
         """
-        if export_format.lower() == 'json':
+        if export_format.lower() in ('json', 'ndjson'):
             # JSON doesn't support incremental writing well, fall back to batch mode
-            data = self.scrape(query, max_results)
+            data = self.scrape(query, max_results, validate_websites)
             if not data:
                 logger.error("No data to export")
                 return None
             try:
-                output_path = self.exporter.export_to_json(data, output_file)
+                if export_format.lower() == 'ndjson':
+                    output_path = self.exporter.export_to_ndjson(data, output_file)
+                else:
+                    output_path = self.exporter.export_to_json(data, output_file)
                 logger.info(f"Data exported to {output_path}")
                 return output_path
             except Exception as e:
@@ -150,19 +196,19 @@ class GoogleMapsScraper:
                 existing_names = self.exporter.load_existing_business_names(output_file)
             else:
                 output_path = self.exporter.init_incremental_csv(output_file, resume=False)
-                existing_names = set()
+                existing_names = BusinessNameIndex()
             
             logger.info(f"Output file: {output_path}")
             
             self.browser_manager.start()
             
-            if not self.browser_manager.navigate_to_search(query):
-                logger.error("Failed to navigate to search results")
-                self.exporter.close_csv()
-                return None
-            
             # Collect business URLs if this is a new session
             if not resuming:
+                if not self.browser_manager.navigate_to_search(query):
+                    logger.error("Failed to navigate to search results")
+                    self.exporter.close_csv()
+                    return None
+                
                 result_count = self.browser_manager.scroll_results_container(max_results)
                 logger.info(f"Loaded {result_count} business listings")
                 
@@ -183,12 +229,17 @@ class GoogleMapsScraper:
                 # Store URLs in extractor
                 self.data_extractor.business_urls = business_urls
             else:
-                # Restore URLs to extractor
+                # Restore URLs to extractor; place pages are opened directly,
+                # so the search results page is not loaded again
                 self.data_extractor.business_urls = state.business_urls
                 logger.info(f"Restored {len(state.business_urls)} business URLs from state")
             
             extracted_count = 0
             
+            def track_progress():
+                # Rows must reach the disk before the state marks them processed
+                state_manager.update_state(state, before_flush=self.exporter.checkpoint)
+            
             # Extract with callback for incremental saving and state updates
             def save_and_track_business(business_data: Optional[Dict], index: int):
                 nonlocal extracted_count
@@ -196,19 +247,19 @@ class GoogleMapsScraper:
                 if business_data is None:
                     # Failed extraction
                     state.mark_failed(index)
-                    state_manager.update_state(state)
+                    track_progress()
                     return
                 
                 # Check for duplicates
                 business_name = business_data.get('name', '').strip().lower()
                 if business_name in existing_names:
-                    logger.debug(f"Skipping duplicate: {business_data.get('name', 'Unknown')}")
+                    logger.debug("Skipping duplicate: %s", business_data.get('name', 'Unknown'))
                     state.mark_processed(index)
-                    state_manager.update_state(state)
+                    track_progress()
                     return
                 
                 # Validate
-                validated = self.validator.validate_business(business_data)
+                validated = self.validator.validate_business(business_data, validate_websites)
                 # Score
                 scored = self.scorer.calculate_score(validated)
                 validated['lead_score'] = scored
@@ -219,7 +270,7 @@ class GoogleMapsScraper:
                 
                 # Update state
                 state.mark_processed(index)
-                state_manager.update_state(state)
+                track_progress()
                 
                 # Add to existing names
                 if business_name:
@@ -234,13 +285,15 @@ class GoogleMapsScraper:
             self.data_extractor.extract_from_listings_incremental(
                 max_results=max_results,
                 callback=save_and_track_business,
-                processed_indices=state.processed_indices if resuming else None
+                processed_indices=state.processed_indices if resuming else None,
+                concurrency=self.workers
             )
             
             logger.info(f"Extraction complete. Total businesses saved in this session: {extracted_count}")
             logger.info(f"Total businesses in file: {len(state.processed_indices)}")
             
             # Mark state as completed
+            self.exporter.checkpoint()
             state_manager.mark_completed(state)
             
             return output_path
@@ -250,6 +303,7 @@ class GoogleMapsScraper:
             if state:
                 logger.info(f"✅ Progress saved! Run the same command to resume.")
                 logger.info(f"   Processed: {len(state.processed_indices)}/{len(state.business_urls)}")
+                self.exporter.checkpoint()
                 state_manager.save_state(state)
             raise
             
@@ -258,6 +312,7 @@ class GoogleMapsScraper:
             if state and extracted_count > 0:
                 logger.info(f"Partial data saved: {extracted_count} businesses before error")
                 logger.info(f"Run the same command to resume from where it stopped.")
+                self.exporter.checkpoint()
                 state_manager.save_state(state)
                 return output_path
             return None
@@ -15,10 +15,10 @@ class Business:
     address: str = "N/A"
     phone: str = "N/A"
     website: str = "N/A"
-    rating: str = "N/A"
-    reviews: str = "N/A"
+    rating: Optional[float] = None
+    reviews: Optional[int] = None
     phone_valid: bool = False
-    website_valid: bool = False
+    website_valid: Optional[bool] = False
     lead_score: int = 0
     
     def to_dict(self) -> dict:
@@ -45,8 +45,8 @@ class Business:
             address=data.get('address', 'N/A'),
             phone=data.get('phone', 'N/A'),
             website=data.get('website', 'N/A'),
-            rating=data.get('rating', 'N/A'),
-            reviews=data.get('reviews', 'N/A'),
+            rating=data.get('rating'),
+            reviews=data.get('reviews'),
             phone_valid=data.get('phone_valid', False),
             website_valid=data.get('website_valid', False),
             lead_score=data.get('lead_score', 0)
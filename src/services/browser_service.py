@@ -4,10 +4,9 @@ Browser automation service using Playwright.
 
 import random
 import time
-from typing import Optional
+from typing import List, Optional
 
-from playwright.sync_api import sync_playwright, Page, Browser, Playwright
-from tqdm import tqdm
+from playwright.sync_api import sync_playwright, Page, Browser, BrowserContext, Playwright, Route
 
 from src.utils.constants import (
     USER_AGENTS, 
@@ -15,51 +14,140 @@ from src.utils.constants import (
     SELECTORS, 
     DEFAULT_VIEWPORT,
     HTTP_HEADERS,
+    BROWSER_CONFIG,
     SCROLL_CONFIG
 )
-from src.utils.helpers import add_random_delay, encode_search_query
+from src.utils.helpers import encode_search_query
+from src.services.validation_service import _get_session
+
+
+# Installs a link counter on the results feed. A MutationObserver only marks
+# the count stale, so the links are re-counted at most once per read and only
+# after the feed actually changed.
+_INSTALL_LINK_COUNTER_JS = """
+(feed, selector) => {
+    const state = {count: feed.querySelectorAll(selector).length, stale: false};
+    new MutationObserver(() => { state.stale = true; })
+        .observe(feed, {childList: true, subtree: true});
+    feed.__leadgenLinkCount = () => {
+        if (state.stale) {
+            state.count = feed.querySelectorAll(selector).length;
+            state.stale = false;
+        }
+        return state.count;
+    };
+}
+"""
+
+
+def _block_heavy_resources(route: Route) -> None:
+    """Abort requests for resources and trackers the extractor never reads."""
+    request = route.request
+    if (
+        request.resource_type in BROWSER_CONFIG['blocked_resource_types']
+        or any(fragment in request.url for fragment in BROWSER_CONFIG['blocked_url_fragments'])
+    ):
+        route.abort()
+    else:
+        route.continue_()
 
 
 class BrowserManager:
     """Manages browser lifecycle and navigation."""
     
-    def __init__(self, headless: bool = True, slow_mo: int = 50):
+    DEBUG_SLOW_MO = 250
+    
+    def __init__(
+        self,
+        headless: bool = True,
+        slow_mo: int = 0,
+        debug: bool = False,
+        user_data_dir: Optional[str] = None
+    ):
         """
         Initialize browser manager.
         
         Args:
             headless: Run browser in headless mode
             slow_mo: Slow down operations by specified milliseconds
+            debug: Show the browser and slow it down for a human to watch
+            user_data_dir: Browser profile directory to reuse between runs
+                (default: BROWSER_CONFIG['user_data_dir'])
         """
+        if debug:
+            headless = False
+            slow_mo = slow_mo or self.DEBUG_SLOW_MO
+        
         self.headless = headless
         self.slow_mo = slow_mo
         self.playwright: Optional[Playwright] = None
+        self.user_data_dir = user_data_dir or BROWSER_CONFIG['user_data_dir']
         self.browser: Optional[Browser] = None
+        self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
         self.last_query: Optional[str] = None
         
     def start(self) -> None:
-        """Initialize and start the Playwright browser."""
+        """
+        Initialize and start the Playwright browser.
+        
+        With a user_data_dir the profile is opened as a persistent context,
+        so its disk cache and cookies stay warm between runs.
+        """
         self.playwright = sync_playwright().start()
         
-        self.browser = self.playwright.chromium.launch(
-            headless=self.headless,
-            slow_mo=self.slow_mo
-        )
+        context_options = {
+            'user_agent': random.choice(USER_AGENTS),
+            'viewport': DEFAULT_VIEWPORT,
+            'extra_http_headers': HTTP_HEADERS
+        }
         
-        self.page = self.browser.new_page(
-            user_agent=random.choice(USER_AGENTS),
-            viewport=DEFAULT_VIEWPORT
-        )
+        if self.user_data_dir:
+            self.context = self.playwright.chromium.launch_persistent_context(
+                self.user_data_dir,
+                headless=self.headless,
+                slow_mo=self.slow_mo,
+                args=BROWSER_CONFIG['launch_args'],
+                **context_options
+            )
+            pages = self.context.pages
+            self.page = pages[0] if pages else self.context.new_page()
+        else:
+            self.browser = self.playwright.chromium.launch(
+                headless=self.headless,
+                slow_mo=self.slow_mo,
+                args=BROWSER_CONFIG['launch_args']
+            )
+            self.context = self.browser.new_context(**context_options)
+            self.page = self.context.new_page()
         
-        self.page.set_extra_http_headers(HTTP_HEADERS)
+        # Skip images, media and fonts on every page of the context
+        self.context.route("**/*", _block_heavy_resources)
+    
+    def __enter__(self) -> 'BrowserManager':
+        """Start the browser when entering a with block."""
+        try:
+            self.start()
+        except BaseException:
+            self.close()
+            raise
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the browser when leaving a with block, even on errors."""
+        self.close()
     
     def close(self) -> None:
         """Close the browser and clean up resources."""
+        if self.context:
+            self.context.close()
+            self.context = None
         if self.browser:
             self.browser.close()
+            self.browser = None
         if self.playwright:
             self.playwright.stop()
+            self.playwright = None
     
     def navigate_to_search(self, query: str, max_retries: int = 3) -> bool:
         """
@@ -81,6 +169,11 @@ class BrowserManager:
         for attempt in range(max_retries):
             try:
                 logger.info(f"Navigating to Google Maps (attempt {attempt + 1}/{max_retries})")
+                
+                # On retries, skip the full page load while Google keeps failing
+                if attempt > 0 and not self._probe_url(url):
+                    raise RuntimeError("Pre-check request failed; skipping page load")
+                
                 self.page.goto(url, timeout=60000, wait_until='domcontentloaded')
                 self.last_query = query
                 
@@ -92,8 +185,13 @@ class BrowserManager:
             except Exception as e:
                 logger.warning(f"Navigation attempt {attempt + 1} failed: {e}")
                 if attempt < max_retries - 1:
-                    wait_time = (attempt + 1) * 5  # Increasing wait time
-                    logger.info(f"Retrying in {wait_time} seconds...")
+                    # Exponential backoff with jitter, starting from the
+                    # original 5s so Google gets at least as long to recover
+                    wait_time = min(
+                        BROWSER_CONFIG['retry_backoff_max'],
+                        5 * 2 ** attempt + random.random()
+                    )
+                    logger.info(f"Retrying in {wait_time:.1f} seconds...")
                     time.sleep(wait_time)
                 else:
                     logger.error(f"Failed to navigate after {max_retries} attempts")
@@ -101,6 +199,33 @@ class BrowserManager:
         
         return False
     
+    @staticmethod
+    def _probe_url(url: str) -> bool:
+        """
+        Check with a cheap HEAD request that a URL currently responds.
+        
+        Uses the pooled session shared with website validation, so probes
+        reuse its keep-alive connections.
+        
+        Args:
+            url: URL to probe
+            
+        Returns:
+            bool: False on timeouts, connection errors and 4xx/5xx responses
+        """
+        import requests
+        
+        try:
+            with _get_session().head(
+                url,
+                headers={'User-Agent': random.choice(USER_AGENTS)},
+                timeout=5,
+                allow_redirects=True
+            ) as response:
+                return response.status_code < 400
+        except requests.RequestException:
+            return False
+    
     def scroll_results_container(self, max_results: int = 100) -> int:
         """
         Scroll through results to load more businesses with improved strategy.
@@ -111,27 +236,31 @@ class BrowserManager:
         Returns:
             int: Number of results loaded
         """
+        from tqdm import tqdm
         from src.utils.logger import get_logger
         logger = get_logger(__name__)
         
-        results_selector = SELECTORS['results_feed']
+        # Resolve the feed once and reuse the handle for every scroll
+        feed = self.page.query_selector(SELECTORS['results_feed'])
         
-        if not self.page.query_selector(results_selector):
+        if not feed:
             return 0
         
+        feed.evaluate(_INSTALL_LINK_COUNTER_JS, SELECTORS['business_link'])
+        
         previous_count = 0
         consecutive_same_count = 0
         scroll_iteration = 0
         
-        with tqdm(total=max_results, desc="Loading results") as pbar:
+        with tqdm(total=max_results, desc="Loading results", mininterval=1.0, disable=None) as pbar:
             while scroll_iteration < SCROLL_CONFIG['max_attempts']:
-                results = self.page.query_selector_all(SELECTORS['business_link'])
-                current_count = len(results)
+                # Read the observed count; no element handles are created
+                current_count = feed.evaluate('(el) => el.__leadgenLinkCount()')
                 
                 # Update progress bar
                 if current_count > previous_count:
                     pbar.update(current_count - previous_count)
-                    logger.debug(f"Loaded {current_count} results so far")
+                    logger.debug("Loaded %d results so far", current_count)
                     previous_count = current_count
                     consecutive_same_count = 0
                 else:
@@ -150,15 +279,10 @@ class BrowserManager:
                 try:
                     # Multiple small scrolls can trigger better loading
                     for _ in range(3):
-                        self.page.evaluate(f'''
-                            const container = document.querySelector('{results_selector}');
-                            if (container) {{
-                                container.scrollTop = container.scrollHeight;
-                            }}
-                        ''')
+                        feed.evaluate('(el) => { el.scrollTop = el.scrollHeight; }')
                         time.sleep(0.3)
                 except Exception as e:
-                    logger.debug(f"Scroll error: {e}")
+                    logger.debug("Scroll error: %s", e)
                 
                 # Wait for new results to load
                 time.sleep(
@@ -173,20 +297,21 @@ class BrowserManager:
         
         return previous_count
     
-    def get_business_links(self, max_results: int) -> list:
+    def get_business_links(self, max_results: Optional[int] = None) -> List[str]:
         """
-        Get list of business links from search results.
+        Get the hrefs of business links from search results.
+        
+        Hrefs are read in one round-trip; unlike element handles they stay
+        valid when the results DOM changes.
         
         Args:
-            max_results: Maximum number of links to retrieve
+            max_results: Maximum number of links to retrieve (default: all)
             
         Returns:
-            list: List of business link elements
+            list: List of business link hrefs
         """
-        business_links = self.page.query_selector_all(SELECTORS['business_link'])
-        return business_links[:max_results]
-    
-    def navigate_back(self) -> None:
-        """Navigate back to the previous page."""
-        self.page.evaluate('window.history.back()')
-        self.page.wait_for_selector(SELECTORS['business_link'], timeout=10000)
+        hrefs = self.page.eval_on_selector_all(
+            SELECTORS['business_link'],
+            'els => els.map(e => e.getAttribute("href"))'
+        )
+        return hrefs[:max_results]
@@ -0,0 +1,133 @@
+"""
+Result cache service for repeated scrapes.
+Stores validated results on disk keyed by query and parameters.
+"""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Optional, List, Dict
+
+from src.utils.constants import CACHE_CONFIG
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ResultCache:
+    """
+    Disk-backed cache of scrape results.
+    
+    Each entry is a JSON file named after a hash of the normalized query
+    and scrape parameters. Entries older than the TTL are ignored and
+    removed on lookup.
+    """
+    
+    def __init__(self, cache_dir: Optional[str] = None, ttl_seconds: Optional[int] = None):
+        """
+        Initialize result cache.
+        
+        Args:
+            cache_dir: Directory for cache files (default: CACHE_CONFIG['directory'])
+            ttl_seconds: Entry lifetime in seconds (default: CACHE_CONFIG['ttl_seconds'])
+        """
+        self.cache_dir = Path(cache_dir or CACHE_CONFIG['directory']).expanduser()
+        self.ttl_seconds = CACHE_CONFIG['ttl_seconds'] if ttl_seconds is None else ttl_seconds
+    
+    @staticmethod
+    def _generate_key(query: str, max_results: int, validate_websites: bool) -> str:
+        """Generate a cache key for a query and its parameters."""
+        content = f"{query.lower().strip()}|{max_results}|{int(validate_websites)}"
+        return hashlib.sha1(content.encode()).hexdigest()
+    
+    def _get_cache_file_path(self, key: str) -> Path:
+        """Get the path to the cache file for a key."""
+        return self.cache_dir / f"results_{key}.json"
+    
+    def get(
+        self,
+        query: str,
+        max_results: int,
+        validate_websites: bool = False
+    ) -> Optional[List[Dict]]:
+        """
+        Look up cached results for a query.
+        
+        Args:
+            query: Search query
+            max_results: Maximum results
+            validate_websites: Whether results were produced with website checks
+        
+        Returns:
+            List of cached business dictionaries, or None on a miss
+        """
+        cache_file = self._get_cache_file_path(
+            self._generate_key(query, max_results, validate_websites)
+        )
+        
+        if not cache_file.exists():
+            return None
+        
+        try:
+            if time.time() - cache_file.stat().st_mtime > self.ttl_seconds:
+                cache_file.unlink()
+                logger.debug(f"Expired cache entry removed: {cache_file}")
+                return None
+            
+            with cache_file.open('r', encoding='utf-8') as f:
+                results = json.load(f)
+            
+            logger.info(f"Cache hit for query: {query} ({len(results)} results)")
+            return results
+        
+        except Exception as e:
+            logger.warning(f"Failed to read cache entry {cache_file}: {e}")
+            return None
+    
+    def set(
+        self,
+        query: str,
+        max_results: int,
+        results: List[Dict],
+        validate_websites: bool = False
+    ) -> None:
+        """
+        Store results for a query atomically.
+        
+        Args:
+            query: Search query
+            max_results: Maximum results
+            results: Validated business dictionaries
+            validate_websites: Whether results were produced with website checks
+        """
+        cache_file = self._get_cache_file_path(
+            self._generate_key(query, max_results, validate_websites)
+        )
+        temp_file = cache_file.with_suffix('.tmp')
+        
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            
+            with temp_file.open('w', encoding='utf-8') as f:
+                json.dump(results, f, ensure_ascii=False)
+            
+            temp_file.replace(cache_file)
+            logger.debug(f"Cached {len(results)} results for query: {query}")
+        
+        except Exception as e:
+            logger.warning(f"Failed to write cache entry: {e}")
+            if temp_file.exists():
+                temp_file.unlink()
+
+
+# Singleton instance
+_result_cache: Optional[ResultCache] = None
+
+
+def get_result_cache() -> ResultCache:
+    """Get or create the global result cache instance."""
+    global _result_cache
+    if _result_cache is None:
+        _result_cache = ResultCache()
+    return _result_cache
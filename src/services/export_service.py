@@ -3,17 +3,89 @@ Export service for saving data to various formats.
 """
 
 import csv
+import json
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Set
+from typing import Iterable, List, Dict, Optional, Set, Tuple
 
-import pandas as pd
+import numpy as np
 
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON encoding
+    orjson = None
+
+from src.utils.constants import EXPORT_CONFIG
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Preferred column order for exported files; extra fields follow
+_COLUMNS_ORDER = (
+    'name', 'category', 'address', 'phone', 'phone_valid',
+    'website', 'website_valid', 'rating', 'reviews', 'lead_score'
+)
+
+
+
+def _sort_by_lead_score(data: List[Dict]) -> List[Dict]:
+    """
+    Sort businesses by lead score, highest first.
+    
+    Scores are sorted with numpy; the stable sort keeps the input order
+    for equal scores, like sorted(..., reverse=True).
+    
+    Args:
+        data: List of business dictionaries
+        
+    Returns:
+        New list sorted by descending lead score (missing scores count as 0)
+    """
+    scores = np.fromiter(
+        (business.get('lead_score') or 0 for business in data),
+        dtype=np.float64,
+        count=len(data)
+    )
+    order = np.argsort(-scores, kind='stable')
+    return [data[i] for i in order]
+
+
+class BusinessNameIndex:
+    """
+    Set of business names stored as hash fingerprints.
+    
+    Names are normalized (stripped, lowercased) and only their 64-bit hash
+    is kept, which is much smaller than the name strings for large resume
+    files. Supports `in`, add() and len() like a set of names.
+    """
+    
+    def __init__(self, names: Iterable[str] = ()):
+        """
+        Initialize the index.
+        
+        Args:
+            names: Business names to add
+        """
+        self._fingerprints: Set[int] = set()
+        for name in names:
+            self.add(name)
+    
+    @staticmethod
+    def _fingerprint(name: str) -> int:
+        """Hash a normalized business name."""
+        return hash(name.strip().lower())
+    
+    def add(self, name: str) -> None:
+        """Add a business name to the index."""
+        self._fingerprints.add(self._fingerprint(name))
+    
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and self._fingerprint(name) in self._fingerprints
+    
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
 
 class ExportService:
     """Handles exporting business data to various formats with resume support."""
@@ -25,6 +97,8 @@ class ExportService:
         self.csv_filename = None
         self.headers_written = False
         self.fieldnames = None
+        self.rows_since_checkpoint = 0
+        self._resume_names: Optional[BusinessNameIndex] = None
     
     @staticmethod
     def export_to_csv(data: List[Dict], filename: Optional[str] = None) -> str:
@@ -42,22 +116,21 @@ class ExportService:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"business_leads_{timestamp}.csv"
         
-        df = pd.DataFrame(data)
-        
-        columns_order = [
-            'name', 'category', 'address', 'phone', 'phone_valid',
-            'website', 'website_valid', 'rating', 'reviews', 'lead_score'
-        ]
+        # Every key seen in any record, in first-seen order
+        all_columns = dict.fromkeys(key for business in data for key in business)
         
-        columns_order = [col for col in columns_order if col in df.columns]
+        columns_order = [col for col in _COLUMNS_ORDER if col in all_columns]
         
-        for col in df.columns:
+        for col in all_columns:
             if col not in columns_order:
                 columns_order.append(col)
         
-        df = df.sort_values(by='lead_score', ascending=False)
+        sorted_data = _sort_by_lead_score(data)
         
-        df.to_csv(filename, index=False, columns=columns_order)
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=columns_order, extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(sorted_data)
         
         return filename
     
@@ -73,16 +146,51 @@ class ExportService:
         Returns:
             str: Path to the created JSON file
         """
-        import json
-        
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"business_leads_{timestamp}.json"
         
-        sorted_data = sorted(data, key=lambda x: x.get('lead_score', 0), reverse=True)
+        sorted_data = _sort_by_lead_score(data)
+        
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(sorted_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(sorted_data, f, indent=2, ensure_ascii=False)
+        
+        return filename
+    
+    @staticmethod
+    def export_to_ndjson(data: List[Dict], filename: Optional[str] = None) -> str:
+        """
+        Export business data as newline-delimited JSON (one object per line).
+        
+        Records are encoded and written one at a time, so memory use does not
+        grow with the size of the export.
+        
+        Args:
+            data: List of business dictionaries
+            filename: Output filename (auto-generated if None)
+            
+        Returns:
+            str: Path to the created NDJSON file
+        """
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"business_leads_{timestamp}.ndjson"
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(sorted_data, f, indent=2, ensure_ascii=False)
+        sorted_data = _sort_by_lead_score(data)
+        
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                for record in sorted_data:
+                    f.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                for record in sorted_data:
+                    f.write(json.dumps(record, ensure_ascii=False))
+                    f.write('\n')
         
         return filename
     
@@ -109,15 +217,16 @@ class ExportService:
         if resume and file_exists:
             logger.info(f"Resuming: appending to existing file {filename}")
             # Open in append mode
-            self.csv_file = open(filename, 'a', newline='', encoding='utf-8')
+            self.csv_file = open(
+                filename, 'a', newline='', encoding='utf-8',
+                buffering=EXPORT_CONFIG['buffer_size']
+            )
             self.headers_written = True  # Headers already exist
             
-            # Read existing file to get fieldnames
+            # Read existing file once for fieldnames and business names
             try:
-                with open(filename, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    self.fieldnames = reader.fieldnames
-                    logger.debug(f"Loaded existing fieldnames: {self.fieldnames}")
+                self.fieldnames, self._resume_names = self._scan_existing_csv(filename)
+                logger.debug(f"Loaded existing fieldnames: {self.fieldnames}")
             except Exception as e:
                 logger.error(f"Failed to read existing CSV headers: {e}")
                 raise
@@ -126,13 +235,16 @@ class ExportService:
                 logger.warning(f"File {filename} exists but not resuming. It will be overwritten.")
             logger.info(f"Creating new file: {filename}")
             # Open in write mode
-            self.csv_file = open(filename, 'w', newline='', encoding='utf-8')
+            self.csv_file = open(
+                filename, 'w', newline='', encoding='utf-8',
+                buffering=EXPORT_CONFIG['buffer_size']
+            )
             self.headers_written = False
             self.fieldnames = None
         
         return filename
     
-    def load_existing_business_names(self, filename: str) -> Set[str]:
+    def load_existing_business_names(self, filename: str) -> BusinessNameIndex:
         """
         Load business names from existing CSV file to avoid duplicates.
         
@@ -140,28 +252,48 @@ class ExportService:
             filename: CSV filename to read
             
         Returns:
-            Set of business names already in the file
+            Index of business names already in the file
         """
-        existing_names = set()
+        # Reuse the names collected while resuming in init_incremental_csv()
+        if self._resume_names is not None and filename == self.csv_filename:
+            existing_names, self._resume_names = self._resume_names, None
+            logger.info(f"Loaded {len(existing_names)} existing business names from {filename}")
+            return existing_names
+        
+        existing_names = BusinessNameIndex()
         
         if not Path(filename).exists():
             return existing_names
         
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    name = row.get('name', '').strip()
-                    if name and name != 'N/A':
-                        existing_names.add(name.lower())
-            
+            _, existing_names = self._scan_existing_csv(filename)
             logger.info(f"Loaded {len(existing_names)} existing business names from {filename}")
         except Exception as e:
             logger.warning(f"Failed to load existing businesses: {e}")
         
         return existing_names
+    
+    @staticmethod
+    def _scan_existing_csv(filename: str) -> Tuple[Optional[List[str]], BusinessNameIndex]:
+        """
+        Read an existing CSV file once for its header and business names.
         
-        return filename
+        Args:
+            filename: CSV filename to read
+            
+        Returns:
+            Tuple of (fieldnames, index of business names)
+        """
+        existing_names = BusinessNameIndex()
+        
+        with open(filename, 'r', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                name = (row.get('name') or '').strip()
+                if name and name != 'N/A':
+                    existing_names.add(name)
+        
+        return reader.fieldnames, existing_names
     
     def append_to_csv(self, business: Dict) -> None:
         """
@@ -175,10 +307,7 @@ class ExportService:
         
         if not self.headers_written:
             # Define column order
-            columns_order = [
-                'name', 'category', 'address', 'phone', 'phone_valid',
-                'website', 'website_valid', 'rating', 'reviews', 'lead_score'
-            ]
+            columns_order = list(_COLUMNS_ORDER)
             
             # Add any additional columns from business data
             for key in business.keys():
@@ -186,31 +315,35 @@ class ExportService:
                     columns_order.append(key)
             
             self.fieldnames = columns_order
-            self.csv_writer = csv.DictWriter(
-                self.csv_file, 
-                fieldnames=self.fieldnames,
-                extrasaction='ignore'
-            )
-            self.csv_writer.writeheader()
+            self.csv_writer = csv.writer(self.csv_file)
+            self.csv_writer.writerow(self.fieldnames)
             self.csv_file.flush()
             self.headers_written = True
         else:
-            # Resuming mode - create writer with existing fieldnames
+            # Resuming mode - create writer for the existing fieldnames
             if self.csv_writer is None and self.fieldnames:
-                self.csv_writer = csv.DictWriter(
-                    self.csv_file,
-                    fieldnames=self.fieldnames,
-                    extrasaction='ignore'
-                )
+                self.csv_writer = csv.writer(self.csv_file)
+        
+        # Write the business data in column order (buffered; synced every few rows)
+        self.csv_writer.writerow([business.get(field, '') for field in self.fieldnames])
+        self.rows_since_checkpoint += 1
+        
+        if self.rows_since_checkpoint >= EXPORT_CONFIG['fsync_interval']:
+            self.checkpoint()
+    
+    def checkpoint(self) -> None:
+        """Flush buffered rows and force them to disk."""
+        if not self.csv_file:
+            return
         
-        # Write the business data
-        self.csv_writer.writerow(business)
-        self.csv_file.flush()  # Flush to disk immediately
-        os.fsync(self.csv_file.fileno())  # Force write to disk
+        self.csv_file.flush()
+        os.fsync(self.csv_file.fileno())
+        self.rows_since_checkpoint = 0
     
     def close_csv(self) -> None:
         """Close the CSV file."""
         if self.csv_file:
+            self.checkpoint()
             self.csv_file.close()
             self.csv_file = None
             self.csv_writer = None
@@ -3,22 +3,223 @@ Data extraction service with URL tracking and state management.
 Hybrid approach combining URL-based navigation with data attributes.
 """
 
+import queue
 import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import threading
 import time
 import random
-from typing import Dict, List, Optional, Callable
-from urllib.parse import urlparse, parse_qs
+from typing import TYPE_CHECKING, Collection, Dict, List, Optional, Callable
+from urllib.parse import unquote_plus
 
-import requests
-from tqdm import tqdm
-
-from src.utils.constants import SELECTORS, EXTRACTION_CONFIG
-from src.utils.helpers import clean_text, extract_number_from_text, extract_rating_from_label
+from src.utils.constants import SELECTORS, EXTRACTION_CONFIG, HTTP_HEADERS, USER_AGENTS
+from src.utils.helpers import (
+    clean_text,
+    extract_number_from_text,
+    extract_rating_from_label,
+    extract_place_key,
+    is_valid_url
+)
 from src.services.browser_service import BrowserManager
 from src.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from tqdm import tqdm
+
 logger = get_logger(__name__)
 
+_GOOGLE_URL_RE = re.compile(r'[?&]q=([^&]+)')
+_PREFIX_RE = re.compile(r'^(?:Address|Phone|Website): ')
+
+# Matches as soon as any contact field has rendered
+_CONTACT_FIELDS_SELECTOR = ', '.join(SELECTORS[field] for field in ('phone', 'address', 'website'))
+
+# Reads every detail field in a single browser round-trip.
+# Receives SELECTORS and returns raw strings (or null when missing).
+_EXTRACT_JS = """
+(selectors) => {
+    const first = (selector) => document.querySelector(selector);
+    const text = (el) => el ? el.innerText : null;
+    const label = (el) => el ? el.getAttribute('aria-label') : null;
+    
+    const reviews = first(selectors.reviews);
+    const website = first(selectors.website);
+    
+    return {
+        name: text(first(selectors.business_name)),
+        category: text(first(selectors.category)),
+        rating_label: label(first(selectors.rating)),
+        reviews_text: reviews ? text(reviews.querySelector('span') || reviews) : null,
+        address_label: label(first(selectors.address)),
+        phone_label: label(first(selectors.phone)),
+        website_label: label(website),
+        website_href: website ? website.getAttribute('href') : null
+    };
+}
+"""
+
+
+_static_client = None
+_static_client_lock = threading.Lock()
+
+
+def _get_static_client():
+    """
+    Get the shared httpx client for the static HTML fast path.
+    
+    Created on first use so httpx is only imported when the fast path is
+    enabled; keep-alive connections are then reused by all listings and
+    workers (httpx.Client is thread-safe).
+    """
+    global _static_client
+    with _static_client_lock:
+        if _static_client is None:
+            import atexit
+            import httpx
+            
+            _static_client = httpx.Client(
+                headers=HTTP_HEADERS,
+                timeout=EXTRACTION_CONFIG['http_timeout'],
+                follow_redirects=True,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=20)
+            )
+            atexit.register(_static_client.close)
+        return _static_client
+
+
+_redirect_session = None
+_redirect_session_lock = threading.Lock()
+
+
+def _get_redirect_session():
+    """
+    Get the shared pooled session for redirect resolution.
+    
+    Created on first use so requests is only imported when
+    EXTRACTION_CONFIG['resolve_redirects'] is enabled; keep-alive
+    connections are then reused across listings and workers.
+    """
+    global _redirect_session
+    with _redirect_session_lock:
+        if _redirect_session is None:
+            import atexit
+            import requests
+            from requests.adapters import HTTPAdapter
+            
+            adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20)
+            _redirect_session = requests.Session()
+            _redirect_session.headers['User-Agent'] = USER_AGENTS[0]
+            _redirect_session.mount('https://', adapter)
+            _redirect_session.mount('http://', adapter)
+            atexit.register(_redirect_session.close)
+        return _redirect_session
+
+
+def _strip_label_prefix(aria_label: str) -> str:
+    """Remove a leading field prefix ("Phone: ", ...) from an aria-label."""
+    # match() only looks at the start; labels without a prefix are returned as is
+    match = _PREFIX_RE.match(aria_label)
+    return aria_label[match.end():] if match else aria_label
+
+
+@lru_cache(maxsize=4096)
+def _unwrap_google_redirect(href: str) -> Optional[str]:
+    """
+    Get the target URL of a google.com/url redirect link.
+    
+    Args:
+        href: Redirect link
+        
+    Returns:
+        str: Decoded q= parameter, or None if the link has none
+    """
+    website_match = _GOOGLE_URL_RE.search(href)
+    if not website_match:
+        return None
+    # Decode like a query-string value ('+' is a space), as parse_qs would
+    return unquote_plus(website_match.group(1))
+
+
+@lru_cache(maxsize=4096)
+def _resolve_redirect(url: str) -> str:
+    """
+    Follow redirects of a website URL to its final location.
+    
+    Cached, since chains and franchises share the same website.
+    
+    Args:
+        url: Website URL
+        
+    Returns:
+        str: Final URL, or the original URL if the request fails
+    """
+    import requests
+    
+    try:
+        return _get_redirect_session().head(url, allow_redirects=True, timeout=5).url
+    except requests.RequestException as e:
+        logger.debug("Could not resolve redirects for %s: %s", url, e)
+        return url
+
+
+def _node_text(node) -> Optional[str]:
+    """Text of a parsed HTML node, or None if it is missing."""
+    return node.get_text() if node else None
+
+
+def _node_attr(node, attribute: str) -> Optional[str]:
+    """Attribute of a parsed HTML node, or None if it is missing."""
+    return node.get(attribute) if node else None
+
+
+
+class _DetailsCache:
+    """Thread-safe LRU cache of extracted details keyed by place, with a TTL."""
+    
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        """
+        Initialize the cache.
+        
+        Args:
+            maxsize: Maximum number of places to remember
+            ttl_seconds: Seconds cached details stay valid
+        """
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: 'OrderedDict[str, tuple[float, Dict]]' = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, url: str) -> Optional[Dict]:
+        """Get a copy of the cached details for a place URL, or None if unknown or expired."""
+        key = extract_place_key(url)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return dict(entry[1])
+    
+    def put(self, url: str, business_data: Dict) -> None:
+        """Remember the details extracted for a place URL."""
+        key = extract_place_key(url)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), dict(business_data))
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+# Shared by all extractors and workers so repeated places are never re-extracted
+_details_cache = _DetailsCache(
+    EXTRACTION_CONFIG['details_cache_size'],
+    EXTRACTION_CONFIG['details_cache_ttl']
+)
+
 
 class DataExtractorV3:
     """
@@ -51,108 +252,125 @@ class DataExtractorV3:
         """
         Extract detailed information from a business listing page.
         
+        All fields are read in one page.evaluate call; the raw strings are
+        then cleaned up in Python.
+        
         Returns:
             dict: Business data or None if extraction fails
         """
         try:
-            business_data = {
-                'name': self._extract_name(),
-                'category': self._extract_category(),
-                'rating': self._extract_rating(),
-                'reviews': self._extract_reviews(),
-                'address': self._extract_address(),
-                'phone': self._extract_phone(),
-                'website': self._extract_website()
-            }
-            return business_data
+            raw = self.page.evaluate(_EXTRACT_JS, SELECTORS)
+            return self._build_business_data(raw)
         except Exception as e:
             logger.error(f"Failed to extract business details: {e}", exc_info=True)
             return None
     
-    def _extract_name(self) -> str:
-        """Extract business name."""
+    def fetch_static_details(self, business_url: str) -> Optional[Dict]:
+        """
+        Try to extract business details from the server-rendered HTML.
+        
+        Fetches the place URL over plain HTTP and reads the same selectors
+        as the browser path, skipping page rendering entirely.
+        
+        Args:
+            business_url: Google Maps place URL
+            
+        Returns:
+            dict: Business data, or None when name or phone is missing
+                from the static HTML and the browser is needed
+        """
+        import httpx
+        from bs4 import BeautifulSoup
+        
         try:
-            name_element = self.page.query_selector(SELECTORS['business_name'])
-            if name_element:
-                name_text = name_element.inner_text()
-                return clean_text(name_text)
-        except Exception as e:
-            logger.debug(f"Failed to extract name: {e}")
-        return "N/A"
+            response = _get_static_client().get(
+                business_url,
+                headers={'User-Agent': random.choice(USER_AGENTS)}
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.debug("Static fetch failed for %s: %s", business_url, e)
+            return None
+        
+        soup = BeautifulSoup(response.text, 'html.parser')
+        found = {name: soup.select_one(selector) for name, selector in SELECTORS.items()}
+        reviews = found['reviews']
+        
+        raw = {
+            'name': _node_text(found['business_name']),
+            'category': _node_text(found['category']),
+            'rating_label': _node_attr(found['rating'], 'aria-label'),
+            'reviews_text': _node_text(reviews.select_one('span') or reviews) if reviews else None,
+            'address_label': _node_attr(found['address'], 'aria-label'),
+            'phone_label': _node_attr(found['phone'], 'aria-label'),
+            'website_label': _node_attr(found['website'], 'aria-label'),
+            'website_href': _node_attr(found['website'], 'href')
+        }
+        
+        if not raw['name'] or not raw['phone_label']:
+            return None
+        
+        return self._build_business_data(raw)
     
-    def _extract_category(self) -> str:
-        """Extract business category."""
-        try:
-            category_element = self.page.query_selector(SELECTORS['category'])
-            return category_element.inner_text() if category_element else "N/A"
-        except Exception as e:
-            logger.debug(f"Failed to extract category: {e}")
-            return "N/A"
+    @classmethod
+    def _build_business_data(cls, raw: Dict[str, Optional[str]]) -> Dict:
+        """Turn the raw field strings of a listing into business data."""
+        return {
+            'name': cls._parse_name(raw['name']),
+            'category': raw['category'] or "N/A",
+            'rating': cls._parse_rating(raw['rating_label']),
+            'reviews': cls._parse_reviews(raw['reviews_text']),
+            'address': cls._parse_label(raw['address_label']),
+            'phone': cls._parse_label(raw['phone_label']),
+            'website': cls._parse_website(raw['website_label'], raw['website_href'])
+        }
     
-    def _extract_rating(self) -> str:
-        """Extract business rating."""
-        try:
-            rating_element = self.page.query_selector(SELECTORS['rating'])
-            if rating_element:
-                rating_text = rating_element.get_attribute('aria-label')
-                rating = extract_rating_from_label(rating_text)
-                if rating:
-                    return rating
-        except Exception as e:
-            logger.debug(f"Failed to extract rating: {e}")
+    @staticmethod
+    def _parse_name(name_text: Optional[str]) -> str:
+        """Clean business name."""
+        if name_text:
+            return clean_text(name_text)
         return "N/A"
     
-    def _extract_reviews(self) -> str:
-        """Extract number of reviews."""
-        try:
-            reviews_element = self.page.query_selector(SELECTORS['reviews'])
-            if reviews_element:
-                span_element = reviews_element.query_selector('span')
-                reviews_text = span_element.inner_text() if span_element else reviews_element.inner_text()
-                reviews = extract_number_from_text(reviews_text)
-                if reviews:
-                    return reviews
-        except Exception as e:
-            logger.debug(f"Failed to extract reviews: {e}")
-        return "N/A"
+    @staticmethod
+    def _parse_rating(rating_label: Optional[str]) -> Optional[float]:
+        """Parse business rating from its aria-label, or None if missing."""
+        rating = extract_rating_from_label(rating_label)
+        if rating:
+            return float(rating)
+        return None
     
-    def _extract_address(self) -> str:
-        """Extract business address."""
-        try:
-            address_element = self.page.query_selector(SELECTORS['address'])
-            if address_element:
-                return address_element.get_attribute('aria-label').replace('Address: ', '')
-        except Exception as e:
-            logger.debug(f"Failed to extract address: {e}")
-        return "N/A"
+    @staticmethod
+    def _parse_reviews(reviews_text: Optional[str]) -> Optional[int]:
+        """Parse number of reviews as an integer, or None if missing."""
+        if reviews_text:
+            reviews = extract_number_from_text(reviews_text)
+            if reviews:
+                return int(reviews)
+        return None
     
-    def _extract_phone(self) -> str:
-        """Extract business phone number."""
-        try:
-            phone_element = self.page.query_selector(SELECTORS['phone'])
-            if phone_element:
-                return phone_element.get_attribute('aria-label').replace('Phone: ', '')
-        except Exception as e:
-            logger.debug(f"Failed to extract phone: {e}")
-        return "N/A"
+    @staticmethod
+    def _parse_label(aria_label: Optional[str]) -> str:
+        """Strip the field prefix from an aria-label (address, phone, website)."""
+        if aria_label is None:
+            return "N/A"
+        return _strip_label_prefix(aria_label)
     
-    def _extract_website(self) -> str:
-        """Extract business website URL."""
-        try:
-            website_element = self.page.query_selector(SELECTORS['website'])
-            if website_element:
-                website = website_element.get_attribute('aria-label').replace('Website: ', '')
-                href = website_element.get_attribute('href')
-                
-                if href and "google.com/url" in href:
-                    website_match = re.search(r'q=([^&]+)', href)
-                    if website_match:
-                        website = requests.utils.unquote(website_match.group(1))
-                
-                return website
-        except Exception as e:
-            logger.debug(f"Failed to extract website: {e}")
-        return "N/A"
+    @staticmethod
+    def _parse_website(website_label: Optional[str], href: Optional[str]) -> str:
+        """Extract business website URL, unwrapping Google redirect links."""
+        if website_label is None:
+            return "N/A"
+        
+        website = _strip_label_prefix(website_label)
+        
+        if href and "google.com/url" in href:
+            website = _unwrap_google_redirect(href) or website
+        
+        if EXTRACTION_CONFIG['resolve_redirects'] and website.startswith(('http://', 'https://')):
+            website = _resolve_redirect(website)
+        
+        return website
     
     def _collect_business_urls(self, max_results: int) -> List[str]:
         """
@@ -166,17 +384,19 @@ class DataExtractorV3:
         """
         urls = []
         try:
-            # Get all business link elements
-            business_links = self.page.query_selector_all(SELECTORS['business_link'])
+            hrefs = self.browser.get_business_links()
             
-            for link in business_links[:max_results]:
-                try:
-                    href = link.get_attribute('href')
-                    if href and '/maps/place/' in href:
-                        urls.append(href)
-                except Exception as e:
-                    logger.debug(f"Failed to extract URL from link: {e}")
-                    continue
+            # Deduplicate by place so the same business is never visited twice
+            unique_urls = {}
+            for href in hrefs:
+                if href and '/maps/place/' in href:
+                    unique_urls.setdefault(extract_place_key(href), href)
+            
+            urls = list(unique_urls.values())[:max_results]
+            
+            duplicates = len(hrefs) - len(unique_urls)
+            if duplicates > 0:
+                logger.debug(f"Skipped {duplicates} duplicate or non-place links")
             
             logger.info(f"Collected {len(urls)} business URLs")
             
@@ -185,28 +405,190 @@ class DataExtractorV3:
         
         return urls
     
+    def _extract_url(self, index: int, business_url: str) -> Optional[Dict]:
+        """
+        Navigate to a business URL and extract its details.
+        
+        Args:
+            index: Position of the URL in business_urls
+            business_url: Google Maps place URL
+            
+        Returns:
+            dict: Business data or None if the details did not load
+        """
+        if EXTRACTION_CONFIG['http_fast_path']:
+            business_data = self.fetch_static_details(business_url)
+            if business_data:
+                logger.debug("[%d/%d] Extracted from static HTML: %s", index + 1, len(self.business_urls), business_data['name'])
+                _details_cache.put(business_url, business_data)
+                return business_data
+        
+        logger.debug("[%d/%d] Navigating to: %s", index + 1, len(self.business_urls), business_url)
+        
+        self.page.goto(business_url, wait_until='domcontentloaded', timeout=30000)
+        
+        # Wait for the name heading (indicates page loaded); every place has
+        # one, unlike the phone button, so listings without a phone no
+        # longer stall for the full timeout
+        try:
+            self.page.wait_for_selector(
+                SELECTORS['business_name'],
+                timeout=EXTRACTION_CONFIG['detail_timeout']
+            )
+        except Exception as wait_error:
+            logger.debug("Timeout waiting for details on listing %d: %s", index + 1, wait_error)
+            return None
+        
+        # The contact buttons render after the heading; give them a short
+        # window so they are not read as missing. Places without any of
+        # them only cost this timeout.
+        try:
+            self.page.wait_for_selector(
+                _CONTACT_FIELDS_SELECTOR,
+                timeout=EXTRACTION_CONFIG['field_timeout']
+            )
+        except Exception:
+            logger.debug("No phone, address or website rendered for listing %d", index + 1)
+        
+        business_data = self.extract_business_details()
+        if business_data:
+            logger.debug("[%d/%d] Extracted: %s", index + 1, len(self.business_urls), business_data.get('name', 'Unknown'))
+            _details_cache.put(business_url, business_data)
+        else:
+            logger.warning(f"Failed to extract data for listing {index+1}")
+        
+        return business_data
+    
+    def _run_worker(self, work_queue: queue.Queue, progress: '_ExtractionProgress', pbar: 'tqdm') -> None:
+        """
+        Extract queued URLs on this extractor's page until the queue is empty.
+        
+        Args:
+            work_queue: Queue of (index, url) pairs shared by all workers
+            progress: Shared counters and callback dispatch
+            pbar: Shared progress bar
+        """
+        while not progress.stopped.is_set():
+            try:
+                i, business_url = work_queue.get_nowait()
+            except queue.Empty:
+                return
+            
+            # Cached details cost no request, so they need no pacing either
+            business_data = _details_cache.get(business_url)
+            if business_data:
+                logger.debug("[%d/%d] Reused cached details: %s", i + 1, len(self.business_urls), business_data['name'])
+                progress.record(business_data, i)
+                pbar.update(1)
+                continue
+            
+            failed_with_error = False
+            try:
+                business_data = self._extract_url(i, business_url)
+            except Exception as e:
+                logger.error(f"Error extracting listing {i+1}: {e}")
+                business_data = None
+                failed_with_error = True
+            
+            progress.record(business_data, i)
+            pbar.update(1)
+            
+            if progress.stopped.is_set():
+                break
+            
+            self._politeness_delay(failed_with_error)
+    
+    @staticmethod
+    def _politeness_delay(after_error: bool = False) -> None:
+        """
+        Sleep once between listings to keep a human-like request pace.
+        
+        This is the only deliberate wait per listing; page readiness is left
+        to Playwright's own waits.
+        
+        Args:
+            after_error: Back off longer after a failed extraction
+        """
+        if after_error:
+            time.sleep(random.uniform(2.0, 4.0))
+        else:
+            time.sleep(random.uniform(
+                EXTRACTION_CONFIG['min_delay'],
+                EXTRACTION_CONFIG['max_delay']
+            ))
+    
+    def _run_browser_worker(
+        self,
+        work_queue: queue.Queue,
+        progress: '_ExtractionProgress',
+        pbar: 'tqdm',
+        start_delay: float = 0.0
+    ) -> None:
+        """
+        Run an extraction worker in its own browser.
+        
+        Playwright's sync objects are bound to the thread that created them,
+        so every worker thread launches and closes its own browser. Workers
+        always use a fresh profile since a profile directory can only be
+        opened by one browser at a time.
+        
+        Args:
+            work_queue: Queue of (index, url) pairs shared by all workers
+            progress: Shared counters and callback dispatch
+            pbar: Shared progress bar
+            start_delay: Seconds to wait before the first request, so
+                workers do not hit Google at the same moment
+        """
+        try:
+            with BrowserManager(headless=self.browser.headless, slow_mo=self.browser.slow_mo) as browser:
+                # Returns early when the extraction is stopped meanwhile
+                if progress.stopped.wait(start_delay):
+                    return
+                worker = DataExtractorV3(browser)
+                worker.business_urls = self.business_urls
+                worker._run_worker(work_queue, progress, pbar)
+        except Exception as e:
+            logger.error(f"Extraction worker failed: {e}")
+    
+    @staticmethod
+    def _stagger_delay(worker_number: int) -> float:
+        """Jittered start delay for the n-th extra worker."""
+        return worker_number * random.uniform(
+            EXTRACTION_CONFIG['min_delay'],
+            EXTRACTION_CONFIG['max_delay']
+        )
+    
     def extract_from_listings_incremental(
         self,
         max_results: int = 100,
         callback: Optional[Callable[[Dict, int], None]] = None,
         start_index: int = 0,
-        processed_indices: Optional[set] = None
+        processed_indices: Optional[Collection[int]] = None,
+        concurrency: Optional[int] = None
     ) -> int:
         """
         Extract data using URL-based navigation with resume support.
         
+        With concurrency > 1, pending URLs are shared between this extractor's
+        page and additional worker browsers. The callback is always invoked
+        from one thread at a time.
+        
         Args:
             max_results: Maximum number of businesses to extract
             callback: Function to call with each extracted business (receives Dict and index)
             start_index: Index to start extraction from (for resume)
-            processed_indices: Set of already processed indices (for resume)
+            processed_indices: Already processed indices, e.g. a set or IndexBitset (for resume)
+            concurrency: Number of pages extracting in parallel
+                (default: EXTRACTION_CONFIG['concurrency'])
             
         Returns:
             int: Number of successfully extracted businesses
         """
-        # Store search URL for recovery
-        self.search_url = self.page.url
-        logger.info(f"Search URL: {self.search_url}")
+        # Store search URL for recovery; resumed sessions skip the search,
+        # so the page may still be blank and the previous value is kept
+        if is_valid_url(self.page.url):
+            self.search_url = self.page.url
+            logger.info(f"Search URL: {self.search_url}")
         
         # Collect all business URLs upfront if not already collected
         if not self.business_urls:
@@ -217,11 +599,6 @@ class DataExtractorV3:
             logger.error("No business URLs collected")
             return 0
         
-        extracted_count = 0
-        failed_count = 0
-        consecutive_failures = 0
-        max_consecutive_failures = 5
-        
         # Initialize processed indices set if not provided
         if processed_indices is None:
             processed_indices = set()
@@ -232,94 +609,126 @@ class DataExtractorV3:
             if i not in processed_indices
         ]
         
+        if concurrency is None:
+            concurrency = EXTRACTION_CONFIG['concurrency']
+        concurrency = max(1, min(concurrency, len(urls_to_process)))
+        
         logger.info(
             f"Starting extraction: {len(urls_to_process)} pending, "
             f"{len(processed_indices)} already processed, "
-            f"{len(self.business_urls)} total"
+            f"{len(self.business_urls)} total, {concurrency} worker(s)"
         )
         
-        for i, business_url in tqdm(urls_to_process, desc="Extracting & saving"):
+        work_queue = queue.Queue()
+        for item in urls_to_process:
+            work_queue.put(item)
+        
+        progress = _ExtractionProgress(callback)
+        
+        from tqdm import tqdm
+        
+        # Redraw at most once a second; disable=None turns the bar off when
+        # output is not a terminal (CI, log files, MCP server)
+        with tqdm(
+            total=len(urls_to_process),
+            desc="Extracting & saving",
+            mininterval=1.0,
+            disable=None
+        ) as pbar:
+            workers = [
+                threading.Thread(
+                    target=self._run_browser_worker,
+                    args=(work_queue, progress, pbar, self._stagger_delay(n)),
+                    name=f"extraction-worker-{n}",
+                    daemon=True
+                )
+                for n in range(1, concurrency)
+            ]
+            for worker in workers:
+                worker.start()
+            
             try:
-                # Navigate directly to business URL
-                logger.debug(f"[{i+1}/{len(self.business_urls)}] Navigating to: {business_url}")
-                
-                self.page.goto(business_url, wait_until='domcontentloaded', timeout=30000)
-                
-                # Wait for phone element (indicates page loaded)
-                try:
-                    self.page.wait_for_selector(
-                        SELECTORS['phone'],
-                        timeout=EXTRACTION_CONFIG['detail_timeout']
-                    )
-                    time.sleep(random.uniform(1.0, 2.0))
-                except Exception as wait_error:
-                    logger.debug(f"Timeout waiting for details on listing {i+1}: {wait_error}")
-                    consecutive_failures += 1
-                    failed_count += 1
-                    
-                    # Call callback with failure info
-                    if callback:
-                        try:
-                            callback(None, i)
-                        except Exception as callback_error:
-                            logger.error(f"Callback error for failed listing {i+1}: {callback_error}")
-                    
-                    continue
-                
-                # Extract business data
-                business_data = self.extract_business_details()
-                if business_data:
-                    extracted_count += 1
-                    consecutive_failures = 0  # Reset on success
-                    logger.debug(f"[{i+1}/{len(self.business_urls)}] Extracted: {business_data.get('name', 'Unknown')}")
-                    
-                    # Call callback immediately with data and index
-                    if callback:
-                        try:
-                            callback(business_data, i)
-                        except Exception as callback_error:
-                            logger.error(f"Callback error for business {i+1}: {callback_error}")
-                else:
-                    logger.warning(f"Failed to extract data for listing {i+1}")
-                    failed_count += 1
-                    consecutive_failures += 1
-                    
-                    # Call callback with failure info
-                    if callback:
-                        try:
-                            callback(None, i)
-                        except Exception as callback_error:
-                            logger.error(f"Callback error for failed listing {i+1}: {callback_error}")
-                
-                # Check if too many consecutive failures
-                if consecutive_failures >= max_consecutive_failures:
-                    logger.error(f"Too many consecutive failures ({consecutive_failures}). Stopping.")
-                    break
-                
-                # Random delay between extractions
-                time.sleep(random.uniform(
-                    EXTRACTION_CONFIG['min_delay'],
-                    EXTRACTION_CONFIG['max_delay']
-                ))
-                
-            except Exception as e:
-                logger.error(f"Error extracting listing {i+1}: {e}")
-                consecutive_failures += 1
-                failed_count += 1
-                
-                # Call callback with failure info
-                if callback:
-                    try:
-                        callback(None, i)
-                    except Exception as callback_error:
-                        logger.error(f"Callback error for exception at {i+1}: {callback_error}")
-                
-                if consecutive_failures >= max_consecutive_failures:
-                    logger.error(f"Too many consecutive failures ({consecutive_failures}). Stopping extraction.")
-                    break
-                
-                # Longer delay after errors
-                time.sleep(random.uniform(2.0, 4.0))
-        
-        logger.info(f"Extraction complete: {extracted_count} successful, {failed_count} failed")
-        return extracted_count
+                # This thread keeps working on the already open browser
+                self._run_worker(work_queue, progress, pbar)
+            except BaseException:
+                progress.stopped.set()
+                raise
+            finally:
+                for worker in workers:
+                    worker.join()
+                # Every recorded result must be saved before returning
+                progress.close()
+        
+        logger.info(
+            f"Extraction complete: {progress.extracted_count} successful, "
+            f"{progress.failed_count} failed"
+        )
+        return progress.extracted_count
+
+
+class _ExtractionProgress:
+    """
+    Counters and callback dispatch shared by extraction workers.
+    
+    Callbacks run one at a time on a dedicated thread, in the order results
+    are recorded, so saving a result overlaps with loading the next page.
+    """
+    
+    def __init__(
+        self,
+        callback: Optional[Callable[[Optional[Dict], int], None]],
+        max_consecutive_failures: int = 5
+    ):
+        """
+        Initialize shared progress.
+        
+        Args:
+            callback: Function to call with each result (receives Dict or None, and index)
+            max_consecutive_failures: Stop all workers after this many failures in a row
+        """
+        self.callback = callback
+        self.max_consecutive_failures = max_consecutive_failures
+        self.extracted_count = 0
+        self.failed_count = 0
+        self.consecutive_failures = 0
+        self.stopped = threading.Event()
+        self._lock = threading.Lock()
+        self._callback_executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="extraction-callback"
+        )
+    
+    def record(self, business_data: Optional[Dict], index: int) -> None:
+        """
+        Record one extraction result and pass it to the callback.
+        
+        Args:
+            business_data: Extracted business, or None on failure
+            index: Position of the URL in business_urls
+        """
+        with self._lock:
+            if business_data:
+                self.extracted_count += 1
+                self.consecutive_failures = 0  # Reset on success
+            else:
+                self.failed_count += 1
+                self.consecutive_failures += 1
+            
+            if self.callback:
+                self._callback_executor.submit(self._run_callback, business_data, index)
+            
+            # Check if too many consecutive failures
+            if self.consecutive_failures >= self.max_consecutive_failures:
+                logger.error(f"Too many consecutive failures ({self.consecutive_failures}). Stopping.")
+                self.stopped.set()
+    
+    def _run_callback(self, business_data: Optional[Dict], index: int) -> None:
+        """Invoke the callback for one result, logging its errors."""
+        try:
+            self.callback(business_data, index)
+        except Exception as callback_error:
+            logger.error(f"Callback error for listing {index+1}: {callback_error}")
+    
+    def close(self) -> None:
+        """Wait for all pending callbacks to finish."""
+        self._callback_executor.shutdown(wait=True)
@@ -2,10 +2,81 @@
 Lead scoring service to rank business quality.
 """
 
+import math
 from typing import Dict
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Optional: compiled scoring kernel
+    njit = None
+
 from src.utils.constants import LEAD_SCORING
 
+# Scoring weights bound once at import instead of looked up per business
+_BASE_SCORE = LEAD_SCORING['base_score']
+_MAX_SCORE = LEAD_SCORING['max_score']
+_NO_WEBSITE = LEAD_SCORING['no_website']
+_INVALID_WEBSITE = LEAD_SCORING['invalid_website']
+_HIGH_RATING_THRESHOLD = LEAD_SCORING['high_rating_threshold']
+_HIGH_RATING_BONUS = LEAD_SCORING['high_rating_bonus']
+_LOW_RATING_THRESHOLD = LEAD_SCORING['low_rating_threshold']
+_LOW_RATING_BONUS = LEAD_SCORING['low_rating_bonus']
+_HIGH_REVIEWS_THRESHOLD = LEAD_SCORING['high_reviews_threshold']
+_HIGH_REVIEWS_BONUS = LEAD_SCORING['high_reviews_bonus']
+_LOW_REVIEWS_THRESHOLD = LEAD_SCORING['low_reviews_threshold']
+_LOW_REVIEWS_BONUS = LEAD_SCORING['low_reviews_bonus']
+
+
+def _as_number(value, parse) -> float:
+    """Parse a rating/review value like the scalar scorer, NaN if unusable."""
+    if value is None or value == "N/A":
+        return math.nan
+    if type(value) is parse:
+        # Already typed by the extractor; no parsing needed
+        return value
+    try:
+        return parse(value)
+    except ValueError:
+        return math.nan
+
+
+def _score_kernel(
+    ratings, reviews, website_scores,
+    base_score, max_score,
+    high_rating_threshold, high_rating_bonus, low_rating_threshold, low_rating_bonus,
+    high_reviews_threshold, high_reviews_bonus, low_reviews_threshold, low_reviews_bonus
+):
+    """
+    Score arrays of ratings, review counts and website scores.
+    
+    Plain loops over primitive arrays so Numba can compile it; NaN ratings
+    and reviews fail every comparison and score 0.
+    """
+    scores = np.empty(ratings.shape[0], dtype=np.int64)
+    for i in range(ratings.shape[0]):
+        score = base_score + website_scores[i]
+        
+        rating = ratings[i]
+        if rating >= high_rating_threshold:
+            score += high_rating_bonus
+        elif rating < low_rating_threshold:
+            score += low_rating_bonus
+        
+        review_count = reviews[i]
+        if review_count > high_reviews_threshold:
+            score += high_reviews_bonus
+        elif review_count < low_reviews_threshold:
+            score += low_reviews_bonus
+        
+        scores[i] = min(score, max_score)
+    return scores
+
+
+if njit is not None:
+    _score_kernel = njit(cache=True)(_score_kernel)
+
 
 class LeadScoringService:
     """Calculates lead quality scores for businesses."""
@@ -20,67 +91,101 @@ class LeadScoringService:
         Returns:
             int: Lead quality score (0-100)
         """
-        score = LEAD_SCORING['base_score']
+        # Fused scorer: each field is read once and the rating and review
+        # thresholds are applied inline; missing or unparsable values become
+        # NaN, which fails every comparison and scores 0 (as in score_batch)
+        score = _BASE_SCORE + self._score_website(business)
+        
+        rating = _as_number(business.get('rating'), float)
+        if rating >= _HIGH_RATING_THRESHOLD:
+            score += _HIGH_RATING_BONUS
+        elif rating < _LOW_RATING_THRESHOLD:
+            score += _LOW_RATING_BONUS
         
-        score += self._score_website(business)
-        score += self._score_rating(business)
-        score += self._score_reviews(business)
+        reviews = _as_number(business.get('reviews'), int)
+        if reviews > _HIGH_REVIEWS_THRESHOLD:
+            score += _HIGH_REVIEWS_BONUS
+        elif reviews < _LOW_REVIEWS_THRESHOLD:
+            score += _LOW_REVIEWS_BONUS
         
-        return min(score, LEAD_SCORING['max_score'])
+        return min(score, _MAX_SCORE)
     
     def _score_website(self, business: Dict) -> int:
         """Calculate score based on website presence."""
         if business.get('website') == "N/A":
-            return LEAD_SCORING['no_website']
-        elif not business.get('website_valid', False):
-            return LEAD_SCORING['invalid_website']
-        return 0
-    
-    def _score_rating(self, business: Dict) -> int:
-        """Calculate score based on business rating."""
-        rating_str = business.get('rating', 'N/A')
-        if rating_str == "N/A":
-            return 0
-        
-        try:
-            rating = float(rating_str)
-            if rating >= LEAD_SCORING['high_rating_threshold']:
-                return LEAD_SCORING['high_rating_bonus']
-            elif rating < LEAD_SCORING['low_rating_threshold']:
-                return LEAD_SCORING['low_rating_bonus']
-        except ValueError:
-            pass
+            return _NO_WEBSITE
         
-        return 0
-    
-    def _score_reviews(self, business: Dict) -> int:
-        """Calculate score based on review count."""
-        reviews_str = business.get('reviews', 'N/A')
-        if reviews_str == "N/A":
+        website_valid = business.get('website_valid', False)
+        if website_valid is None:
+            # Website was not checked, so no invalid-website bonus
             return 0
-        
-        try:
-            reviews = int(reviews_str)
-            if reviews > LEAD_SCORING['high_reviews_threshold']:
-                return LEAD_SCORING['high_reviews_bonus']
-            elif reviews < LEAD_SCORING['low_reviews_threshold']:
-                return LEAD_SCORING['low_reviews_bonus']
-        except ValueError:
-            pass
-        
+        elif not website_valid:
+            return _INVALID_WEBSITE
         return 0
     
     def score_batch(self, businesses: list[Dict]) -> list[Dict]:
         """
         Calculate lead scores for a batch of businesses.
         
+        Gives the same scores as calculate_score, with the rating and
+        review thresholds applied to whole numpy arrays at once (or in a
+        compiled loop when Numba is installed).
+        
         Args:
             businesses: List of business dictionaries
             
         Returns:
             list: Businesses with lead_score field added
         """
-        for business in businesses:
-            business['lead_score'] = self.calculate_score(business)
+        if not businesses:
+            return businesses
+        
+        count = len(businesses)
+        ratings = np.fromiter(
+            (_as_number(b.get('rating'), float) for b in businesses),
+            dtype=np.float64,
+            count=count
+        )
+        reviews = np.fromiter(
+            (_as_number(b.get('reviews'), int) for b in businesses),
+            dtype=np.float64,
+            count=count
+        )
+        website_scores = np.fromiter(
+            (self._score_website(b) for b in businesses),
+            dtype=np.int64,
+            count=count
+        )
+        
+        if njit is not None:
+            scores = _score_kernel(
+                ratings, reviews, website_scores,
+                _BASE_SCORE, _MAX_SCORE,
+                _HIGH_RATING_THRESHOLD, _HIGH_RATING_BONUS, _LOW_RATING_THRESHOLD, _LOW_RATING_BONUS,
+                _HIGH_REVIEWS_THRESHOLD, _HIGH_REVIEWS_BONUS, _LOW_REVIEWS_THRESHOLD, _LOW_REVIEWS_BONUS
+            )
+            for business, score in zip(businesses, scores.tolist()):
+                business['lead_score'] = score
+            return businesses
+        
+        # NaN (missing or unparsable) fails every comparison and scores 0
+        rating_scores = np.where(
+            ratings >= _HIGH_RATING_THRESHOLD,
+            _HIGH_RATING_BONUS,
+            np.where(ratings < _LOW_RATING_THRESHOLD, _LOW_RATING_BONUS, 0)
+        )
+        review_scores = np.where(
+            reviews > _HIGH_REVIEWS_THRESHOLD,
+            _HIGH_REVIEWS_BONUS,
+            np.where(reviews < _LOW_REVIEWS_THRESHOLD, _LOW_REVIEWS_BONUS, 0)
+        )
+        
+        scores = np.minimum(
+            _BASE_SCORE + website_scores + rating_scores + review_scores,
+            _MAX_SCORE
+        )
+        
+        for business, score in zip(businesses, scores.tolist()):
+            business['lead_score'] = score
         
         return businesses
@@ -3,19 +3,108 @@ State management service for resume functionality.
 Handles checkpoint creation, state persistence, and recovery.
 """
 
+import atexit
+import base64
 import json
 import os
+import re
 import hashlib
-from dataclasses import dataclass, asdict, field
+import shutil
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Set
+from typing import Callable, Iterable, Iterator, Optional, List, Tuple
 from contextlib import contextmanager
 
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON encoding
+    orjson = None
+
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Finds the completion flag without parsing the whole snapshot
+_COMPLETED_RE = re.compile(rb'"completed"\s*:\s*true')
+
+
+class IndexBitset:
+    """
+    Set of non-negative URL indices stored as a bitset.
+    
+    Supports `in`, add(), len() and iteration like a set of ints, using one
+    bit per URL and serializing to a short base64 string.
+    """
+    
+    def __init__(self, indices: Iterable[int] = ()):
+        """
+        Initialize the bitset.
+        
+        Args:
+            indices: Indices to add
+        """
+        self._bits = bytearray()
+        self._count = 0
+        for index in indices:
+            self.add(index)
+    
+    def add(self, index: int) -> None:
+        """Add an index to the set."""
+        byte, mask = index >> 3, 1 << (index & 7)
+        if byte >= len(self._bits):
+            self._bits.extend(bytes(byte + 1 - len(self._bits)))
+        if not self._bits[byte] & mask:
+            self._bits[byte] |= mask
+            self._count += 1
+    
+    def __contains__(self, index: object) -> bool:
+        if not isinstance(index, int) or index < 0:
+            return False
+        byte = index >> 3
+        return byte < len(self._bits) and bool(self._bits[byte] & (1 << (index & 7)))
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def __iter__(self) -> Iterator[int]:
+        for byte_index, byte in enumerate(self._bits):
+            if byte:
+                for bit in range(8):
+                    if byte & (1 << bit):
+                        yield (byte_index << 3) | bit
+    
+    def missing(self, total: int) -> Iterator[int]:
+        """
+        Iterate indices below total that are not in the set.
+        
+        Args:
+            total: Number of indices to check
+        """
+        for index in range(total):
+            byte = index >> 3
+            # Skip whole bytes of processed indices at once
+            if byte < len(self._bits) and self._bits[byte] == 0xFF:
+                continue
+            if index not in self:
+                yield index
+    
+    def to_base64(self) -> str:
+        """Serialize the bitset to a base64 string."""
+        return base64.b64encode(bytes(self._bits)).decode('ascii')
+    
+    @classmethod
+    def from_base64(cls, encoded: str) -> 'IndexBitset':
+        """Deserialize a bitset created by to_base64()."""
+        bitset = cls()
+        bitset._bits = bytearray(base64.b64decode(encoded))
+        bitset._count = sum(bin(byte).count('1') for byte in bitset._bits)
+        return bitset
+    
+    def __repr__(self) -> str:
+        return f"IndexBitset({list(self)})"
+
 
 @dataclass
 class ScrapingState:
@@ -26,47 +115,90 @@ class ScrapingState:
     max_results: int
     output_file: str
     business_urls: List[str] = field(default_factory=list)
-    processed_indices: Set[int] = field(default_factory=set)
+    processed_indices: IndexBitset = field(default_factory=IndexBitset)
     last_processed_index: int = -1
     successful_count: int = 0
     failed_count: int = 0
     created_at: str = field(default_factory=lambda: datetime.now().isoformat())
     updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
     completed: bool = False
+    # Progress events not yet appended to the state log (not serialized)
+    pending_events: List[Tuple[str, int]] = field(default_factory=list, repr=False, compare=False)
     
     def to_dict(self) -> dict:
-        """Convert state to dictionary for JSON serialization."""
-        data = asdict(self)
-        # Convert set to list for JSON serialization
-        data['processed_indices'] = list(self.processed_indices)
-        return data
+        """
+        Convert state to dictionary for JSON serialization.
+        
+        The URL list is kept in a sidecar file by StateManager, so only its
+        length is included.
+        """
+        # Built by hand: asdict() would deep-copy every field first
+        return {
+            'query': self.query,
+            'query_hash': self.query_hash,
+            'max_results': self.max_results,
+            'output_file': self.output_file,
+            'url_count': len(self.business_urls),
+            # Processed indices are stored as a base64 bitset
+            'processed_bitset': self.processed_indices.to_base64(),
+            'last_processed_index': self.last_processed_index,
+            'successful_count': self.successful_count,
+            'failed_count': self.failed_count,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
+            'completed': self.completed
+        }
     
     @classmethod
     def from_dict(cls, data: dict) -> 'ScrapingState':
         """Create state from dictionary."""
-        # Convert list back to set
-        if 'processed_indices' in data:
-            data['processed_indices'] = set(data['processed_indices'])
+        data.pop('url_count', None)
+        if 'processed_bitset' in data:
+            data['processed_indices'] = IndexBitset.from_base64(data.pop('processed_bitset'))
+        elif 'processed_indices' in data:
+            # State files written before the bitset format
+            data['processed_indices'] = IndexBitset(data['processed_indices'])
         return cls(**data)
     
     def mark_processed(self, index: int) -> None:
         """Mark a URL index as processed."""
+        self._apply_processed(index)
+        self.pending_events.append(('p', index))
+    
+    def mark_failed(self, index: int) -> None:
+        """Mark a URL index as failed."""
+        self._apply_failed(index)
+        self.pending_events.append(('f', index))
+    
+    def _apply_processed(self, index: int) -> None:
+        """Record a successful index in the counters."""
         self.processed_indices.add(index)
         self.last_processed_index = max(self.last_processed_index, index)
         self.successful_count += 1
-        self.updated_at = datetime.now().isoformat()
     
-    def mark_failed(self, index: int) -> None:
-        """Mark a URL index as failed."""
+    def _apply_failed(self, index: int) -> None:
+        """Record a failed index in the counters."""
         self.processed_indices.add(index)
         self.failed_count += 1
-        self.updated_at = datetime.now().isoformat()
+    
+    def replay_event(self, event_type: str, index: int) -> None:
+        """
+        Apply a progress event read back from the state log.
+        
+        Args:
+            event_type: 'p' for processed, 'f' for failed
+            index: URL index the event refers to
+        """
+        if event_type == 'p':
+            self._apply_processed(index)
+        elif event_type == 'f':
+            self._apply_failed(index)
     
     def get_pending_urls(self) -> List[tuple[int, str]]:
         """Get list of pending URLs with their indices."""
         return [
-            (i, url) for i, url in enumerate(self.business_urls)
-            if i not in self.processed_indices
+            (i, self.business_urls[i])
+            for i in self.processed_indices.missing(len(self.business_urls))
         ]
     
     def is_url_processed(self, index: int) -> bool:
@@ -86,18 +218,33 @@ class StateManager:
     Manages scraping state persistence and recovery.
     
     Features:
-    - Atomic state updates using temp files
-    - Automatic backup creation
+    - Atomic state snapshots using temp files
+    - Append-only progress log between snapshots
+    - Business URLs written once to a sidecar file
+    - Time- and count-based batched flushes of the progress log
+    - Throttled backup creation on snapshots
     - State validation and recovery
     - Thread-safe operations
     """
     
     STATE_DIR = Path(".scraping_state")
     BACKUP_DIR = STATE_DIR / "backups"
+    # Rewrite the snapshot (and truncate the log) after this many logged events
+    COMPACT_INTERVAL = 100
+    # Flush pending progress at least this often (seconds)
+    FLUSH_INTERVAL = 5.0
+    # Back up a state file at most this often (seconds)
+    BACKUP_INTERVAL = 300
     
     def __init__(self):
         """Initialize state manager."""
         self._ensure_directories()
+        self._logged_events = {}
+        self._last_flush_ts = time.monotonic()
+        self._last_backup_ts = {}
+        self._active_states = {}
+        self._flush_hooks = {}
+        atexit.register(self._flush_active_states)
     
     def _ensure_directories(self) -> None:
         """Create state directories if they don't exist."""
@@ -108,14 +255,103 @@ class StateManager:
     def _generate_query_hash(query: str, max_results: int) -> str:
         """Generate a unique hash for query and parameters."""
         content = f"{query.lower().strip()}_{max_results}"
+        return hashlib.blake2b(content.encode(), digest_size=6).hexdigest()
+    
+    @staticmethod
+    def _generate_legacy_query_hash(query: str, max_results: int) -> str:
+        """Generate the MD5-based hash used by older state files."""
+        content = f"{query.lower().strip()}_{max_results}"
         return hashlib.md5(content.encode()).hexdigest()[:12]
     
     def _get_state_file_path(self, query_hash: str) -> Path:
         """Get the path to state file for a query hash."""
         return self.STATE_DIR / f"state_{query_hash}.json"
     
+    def _get_log_file_path(self, query_hash: str) -> Path:
+        """Get the path to the progress log for a query hash."""
+        return self.STATE_DIR / f"state_{query_hash}.log"
+    
+    def _get_urls_file_path(self, query_hash: str) -> Path:
+        """Get the path to the business URL list for a query hash."""
+        return self.STATE_DIR / f"state_{query_hash}.urls"
+    
+    def _write_urls(self, state: ScrapingState) -> None:
+        """Write the business URLs to the sidecar file, one per line."""
+        urls_file = self._get_urls_file_path(state.query_hash)
+        temp_file = urls_file.with_suffix('.urls.tmp')
+        temp_file.write_text('\n'.join(state.business_urls), encoding='utf-8')
+        temp_file.replace(urls_file)
+    
+    def _append_events(self, state: ScrapingState) -> None:
+        """
+        Append pending progress events to the state log.
+        
+        Each event is one short JSON line, so a write costs O(new events)
+        instead of rewriting the whole state.
+        """
+        if not state.pending_events:
+            return
+        
+        lines = ''.join(
+            json.dumps({'t': event_type, 'i': index}, separators=(',', ':')) + '\n'
+            for event_type, index in state.pending_events
+        )
+        with self._get_log_file_path(state.query_hash).open('a', encoding='utf-8') as f:
+            f.write(lines)
+        
+        logged = self._logged_events.get(state.query_hash, 0) + len(state.pending_events)
+        self._logged_events[state.query_hash] = logged
+        state.pending_events.clear()
+    
+    def _read_state_file(self, state_file: Path) -> ScrapingState:
+        """
+        Load a state snapshot and replay its progress log.
+        
+        Args:
+            state_file: Snapshot file to read
+            
+        Returns:
+            ScrapingState including all logged progress
+        """
+        if orjson is not None:
+            data = orjson.loads(state_file.read_bytes())
+        else:
+            with state_file.open('r', encoding='utf-8') as f:
+                data = json.load(f)
+        
+        if 'business_urls' not in data:
+            urls_file = self._get_urls_file_path(data['query_hash'])
+            data['business_urls'] = urls_file.read_text(encoding='utf-8').splitlines()
+        
+        state = ScrapingState.from_dict(data)
+        
+        log_file = self._get_log_file_path(state.query_hash)
+        if not log_file.exists():
+            return state
+        
+        replayed = 0
+        with log_file.open('r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    # Partially written last line after a crash
+                    break
+                state.replay_event(event['t'], event['i'])
+                replayed += 1
+        
+        if replayed:
+            state.updated_at = datetime.fromtimestamp(log_file.stat().st_mtime).isoformat()
+        self._logged_events[state.query_hash] = replayed
+        return state
+    
     def _create_backup(self, state_file: Path) -> None:
-        """Create a backup of the current state file."""
+        """
+        Create a backup of the current state file.
+        
+        The backup is a hard link when possible: snapshots are replaced by
+        atomic rename, so the link keeps pointing at the old content.
+        """
         if not state_file.exists():
             return
         
@@ -123,14 +359,49 @@ class StateManager:
         backup_file = self.BACKUP_DIR / f"{state_file.stem}_{timestamp}.json"
         
         try:
-            backup_file.write_text(state_file.read_text())
+            try:
+                os.link(state_file, backup_file)
+            except OSError:
+                # No hard links here (e.g. some filesystems); copy in the kernel
+                shutil.copyfile(state_file, backup_file)
             logger.debug(f"Created backup: {backup_file}")
         except Exception as e:
             logger.warning(f"Failed to create backup: {e}")
     
+    def _backup_due(self, query_hash: str) -> bool:
+        """Check whether the state file is due for a backup and record it."""
+        now = time.monotonic()
+        last_backup = self._last_backup_ts.get(query_hash)
+        if last_backup is not None and now - last_backup < self.BACKUP_INTERVAL:
+            return False
+        self._last_backup_ts[query_hash] = now
+        return True
+    
+    def _flush_active_states(self) -> None:
+        """
+        Append unflushed progress of tracked states on interpreter exit.
+        
+        The before_flush hook last passed to update_state runs first, so the
+        log never marks rows as processed that the output file did not sync.
+        """
+        for query_hash, state in self._active_states.items():
+            if state.pending_events:
+                try:
+                    before_flush = self._flush_hooks.get(query_hash)
+                    if before_flush is not None:
+                        before_flush()
+                    self._append_events(state)
+                except Exception as e:
+                    logger.warning(f"Failed to flush state on exit: {e}")
+    
     def save_state(self, state: ScrapingState) -> None:
         """
-        Save scraping state atomically.
+        Save a full snapshot of the scraping state atomically.
+        
+        The snapshot includes all progress, so the progress log is removed
+        afterwards. The previous snapshot is backed up at most once every
+        BACKUP_INTERVAL seconds. Business URLs never change during a session,
+        so their sidecar file is only written when missing.
         
         Args:
             state: Scraping state to save
@@ -140,16 +411,32 @@ class StateManager:
         
         try:
             # Create backup of existing state
-            if state_file.exists():
+            if state_file.exists() and self._backup_due(state.query_hash):
                 self._create_backup(state_file)
             
-            # Write to temporary file first
-            with temp_file.open('w', encoding='utf-8') as f:
-                json.dump(state.to_dict(), f, indent=2)
+            # States loaded from the old format carry their URLs inline
+            if not self._get_urls_file_path(state.query_hash).exists():
+                self._write_urls(state)
+            
+            # Timestamp once per snapshot rather than on every marked index
+            state.updated_at = datetime.now().isoformat()
+            
+            # Write compact JSON to a temporary file first
+            if orjson is not None:
+                temp_file.write_bytes(orjson.dumps(state.to_dict()))
+            else:
+                with temp_file.open('w', encoding='utf-8') as f:
+                    json.dump(state.to_dict(), f, separators=(',', ':'))
             
             # Atomic rename
             temp_file.replace(state_file)
-            logger.debug(f"State saved: {state.query} (Progress: {state.progress_percentage:.1f}%)")
+            
+            # Logged events are now part of the snapshot
+            self._get_log_file_path(state.query_hash).unlink(missing_ok=True)
+            self._logged_events[state.query_hash] = 0
+            state.pending_events.clear()
+            self._last_flush_ts = time.monotonic()
+            logger.debug("State saved: %s (Progress: %.1f%%)", state.query, state.progress_percentage)
             
         except Exception as e:
             logger.error(f"Failed to save state: {e}")
@@ -171,15 +458,18 @@ class StateManager:
         query_hash = self._generate_query_hash(query, max_results)
         state_file = self._get_state_file_path(query_hash)
         
+        if not state_file.exists():
+            # Sessions started before the hash change keep their file name
+            state_file = self._get_state_file_path(
+                self._generate_legacy_query_hash(query, max_results)
+            )
+        
         if not state_file.exists():
             logger.debug(f"No existing state found for query: {query}")
             return None
         
         try:
-            with state_file.open('r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            state = ScrapingState.from_dict(data)
+            state = self._read_state_file(state_file)
             
             # Validate state
             if state.completed:
@@ -187,6 +477,7 @@ class StateManager:
                 return None
             
             logger.info(f"Found existing state: {len(state.processed_indices)}/{len(state.business_urls)} processed")
+            self._active_states[state.query_hash] = state
             return state
             
         except Exception as e:
@@ -222,21 +513,61 @@ class StateManager:
             business_urls=business_urls
         )
         
+        # Replace URLs left behind by a completed session with the same query
+        self._write_urls(state)
         self.save_state(state)
+        self._active_states[query_hash] = state
         logger.info(f"Created new scraping state: {len(business_urls)} URLs to process")
         
         return state
     
-    def update_state(self, state: ScrapingState, save_interval: int = 5) -> None:
+    @staticmethod
+    def should_save(state: ScrapingState, save_interval: int = 5) -> bool:
+        """
+        Check whether the next update_state call will write the state.
+        
+        Args:
+            state: State to check
+            save_interval: Save every N updates (default: 5)
+        """
+        return state.successful_count % save_interval == 0
+    
+    def update_state(
+        self,
+        state: ScrapingState,
+        save_interval: int = 5,
+        before_flush: Optional[Callable[[], None]] = None
+    ) -> None:
         """
         Update state with auto-save throttling.
         
+        Pending progress is appended to the state log every save_interval
+        successes or FLUSH_INTERVAL seconds, whichever comes first; the full
+        snapshot is only rewritten every COMPACT_INTERVAL logged events.
+        
         Args:
             state: State to update
             save_interval: Save every N updates (default: 5)
+            before_flush: Called right before pending progress is written
         """
+        if before_flush is not None:
+            # Also run before the final flush on exit
+            self._flush_hooks[state.query_hash] = before_flush
+        
+        if not state.pending_events:
+            return
+        
         # Save periodically to reduce I/O
-        if state.successful_count % save_interval == 0:
+        now = time.monotonic()
+        if (not self.should_save(state, save_interval)
+                and now - self._last_flush_ts < self.FLUSH_INTERVAL):
+            return
+        
+        if before_flush is not None:
+            before_flush()
+        self._append_events(state)
+        self._last_flush_ts = now
+        if self._logged_events.get(state.query_hash, 0) >= self.COMPACT_INTERVAL:
             self.save_state(state)
     
     def mark_completed(self, state: ScrapingState) -> None:
@@ -247,8 +578,9 @@ class StateManager:
             state: State to mark as completed
         """
         state.completed = True
-        state.updated_at = datetime.now().isoformat()
         self.save_state(state)
+        self._active_states.pop(state.query_hash, None)
+        self._flush_hooks.pop(state.query_hash, None)
         logger.info(f"Scraping session marked as completed")
     
     def delete_state(self, query: str, max_results: int) -> None:
@@ -259,13 +591,22 @@ class StateManager:
             query: Search query
             max_results: Maximum results
         """
-        query_hash = self._generate_query_hash(query, max_results)
-        state_file = self._get_state_file_path(query_hash)
-        
-        if state_file.exists():
-            self._create_backup(state_file)
-            state_file.unlink()
-            logger.info(f"Deleted state file: {state_file}")
+        for query_hash in (
+            self._generate_query_hash(query, max_results),
+            self._generate_legacy_query_hash(query, max_results)
+        ):
+            state_file = self._get_state_file_path(query_hash)
+            
+            if state_file.exists():
+                self._create_backup(state_file)
+                state_file.unlink()
+                logger.info(f"Deleted state file: {state_file}")
+            
+            self._get_log_file_path(query_hash).unlink(missing_ok=True)
+            self._get_urls_file_path(query_hash).unlink(missing_ok=True)
+            self._logged_events.pop(query_hash, None)
+            self._active_states.pop(query_hash, None)
+            self._flush_hooks.pop(query_hash, None)
     
     def list_active_states(self) -> List[ScrapingState]:
         """
@@ -278,10 +619,12 @@ class StateManager:
         
         for state_file in self.STATE_DIR.glob("state_*.json"):
             try:
-                with state_file.open('r', encoding='utf-8') as f:
-                    data = json.load(f)
+                # Completed sessions are skipped before any parsing; the flag
+                # is only ever set in a snapshot, never in the progress log
+                if _COMPLETED_RE.search(state_file.read_bytes()):
+                    continue
                 
-                state = ScrapingState.from_dict(data)
+                state = self._read_state_file(state_file)
                 if not state.completed:
                     active_states.append(state)
                     
@@ -2,20 +2,226 @@
 Data validation service for business information.
 """
 
-import random
-from typing import Dict, List
-
-import phonenumbers
-import requests
-from tqdm import tqdm
+import asyncio
+import re
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional
+from urllib.parse import urlsplit
 
 from src.utils.constants import VALIDATION_CONFIG, USER_AGENTS
 from src.utils.helpers import extract_digits, normalize_url
 
+# Trailing extension such as "ext. 5", "x12" or "#3"
+_PHONE_EXTENSION_RE = re.compile(r'(?:ext\.?|extension|x|#)\s*(\d+)\s*$', re.IGNORECASE)
+
+# Digit counts outside this range can never form a valid number: no
+# numbering plan is shorter, and E.164 caps numbers at 15 digits
+_MIN_PHONE_DIGITS = 4
+_MAX_PHONE_DIGITS = 15
+
+# Dummy numbers common in scraped listings; never worth parsing
+_PLACEHOLDER_PHONES = frozenset({
+    '1234567890', '0000000000', '1111111111', '9999999999', '2345678910', '3141592653'
+})
+
+# Prebuilt request headers, one per user agent; each host always gets the same one
+_HEADERS = [{'User-Agent': ua, 'Accept': '*/*'} for ua in USER_AGENTS]
+
+# Hosts whose pages belong to different businesses
+_SHARED_HOSTS = VALIDATION_CONFIG['shared_hosts']
+
+# HEAD statuses meaning "method not supported" rather than "site broken"
+_HEAD_UNSUPPORTED = (405, 501)
+
+
+def _normalize_phone(phone: str) -> tuple[str, str]:
+    """
+    Reduce a raw phone number to the form that is parsed and cached.
+    
+    Punctuation is dropped, but a leading '+' is kept so international
+    numbers are not read as national ones, and a trailing extension is
+    kept in a form phonenumbers recognizes.
+    
+    Returns:
+        tuple: (digits of the main number, normalized number)
+    """
+    phone = phone.strip()
+    extension = _PHONE_EXTENSION_RE.search(phone)
+    if extension:
+        phone = phone[:extension.start()]
+    
+    digits = extract_digits(phone)
+    number = f"+{digits}" if phone.startswith('+') else digits
+    if extension:
+        number = f"{number} ext. {extension.group(1)}"
+    return digits, number
+
+
+@lru_cache(maxsize=100_000)
+def _format_phone(number: str, country: str) -> Optional[str]:
+    """
+    Validate and format a normalized number, or None if it is not valid.
+    
+    Memoized on the normalized number rather than the raw text, so
+    differently punctuated copies of one number share an entry.
+    """
+    import phonenumbers
+    
+    try:
+        parsed_number = phonenumbers.parse(number, country)
+        
+        # The length-only possibility check is ~10x cheaper than full
+        # validation and rejects most malformed numbers
+        if (phonenumbers.is_possible_number(parsed_number)
+                and phonenumbers.is_valid_number(parsed_number)):
+            return phonenumbers.format_number(
+                parsed_number,
+                phonenumbers.PhoneNumberFormat.INTERNATIONAL
+            )
+    except Exception:
+        pass
+    return None
+
+
+def _website_root(url: str) -> tuple[str, str]:
+    """
+    Split a website into the key a check applies to and the URL checked.
+    
+    The site root is checked rather than the listed page, so the result
+    cached per key is exactly what was requested for it. On shared hosts
+    (VALIDATION_CONFIG['shared_hosts'], e.g. facebook.com) each business
+    has its own page, so the key and checked URL include the first path
+    segment.
+    
+    Returns:
+        tuple: (lowercased host, optionally with its first path segment,
+            and the URL to check); the key is empty when the URL cannot
+            be parsed
+    """
+    try:
+        parts = urlsplit(normalize_url(url))
+    except ValueError:
+        return '', ''
+    host = parts.netloc.lower()
+    
+    if host.removeprefix('www.') in _SHARED_HOSTS:
+        segment = parts.path.strip('/').split('/', 1)[0]
+        if segment:
+            host = f"{host}/{segment}"
+    return host, f"{parts.scheme}://{host}/"
+
+
+def _is_plausible_host(host: str) -> bool:
+    """Cheap shape check so malformed websites never cost a network timeout."""
+    return '.' in host and not host.startswith('.') and ' ' not in host
+
+
+def _group_by_host(urls: List[str]) -> tuple[List[str], Dict[str, str]]:
+    """
+    Group website URLs by the key a check applies to (see _website_root).
+    
+    Returns:
+        tuple: (key of each URL, one representative URL per key in
+            first-seen order)
+    """
+    hosts = [_website_root(url)[0] if url != "N/A" else url for url in urls]
+    unique = {}
+    for host, url in zip(hosts, urls):
+        unique.setdefault(host, url)
+    return hosts, unique
+
+
+class _WebsiteCache:
+    """Thread-safe LRU cache of website check results keyed by host, with a TTL."""
+    
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        """
+        Initialize the cache.
+        
+        Args:
+            maxsize: Maximum number of hosts to remember
+            ttl_seconds: Seconds a result stays valid
+        """
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: 'OrderedDict[str, tuple[float, bool]]' = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, host: str) -> Optional[bool]:
+        """Get the cached result for a host, or None if unknown or expired."""
+        with self._lock:
+            entry = self._entries.get(host)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] > self.ttl_seconds:
+                del self._entries[host]
+                return None
+            self._entries.move_to_end(host)
+            return entry[1]
+    
+    def put(self, host: str, is_valid: bool) -> None:
+        """Remember the check result for a host."""
+        with self._lock:
+            self._entries[host] = (time.monotonic(), is_valid)
+            self._entries.move_to_end(host)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+# Shared by all validators so a domain is checked once per TTL
+_website_cache = _WebsiteCache(
+    VALIDATION_CONFIG['website_cache_size'],
+    VALIDATION_CONFIG['website_cache_ttl']
+)
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def _get_session():
+    """
+    Get the shared pooled HTTP session for website checks.
+    
+    Created on first use so requests is only imported when websites are
+    actually checked. One session reuses connections (and TLS sessions)
+    across checks and across validator instances (each scraper creates
+    its own); the pool is sized for the concurrent batch checks.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            import atexit
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            
+            pool_size = VALIDATION_CONFIG['max_workers']
+            adapter = HTTPAdapter(
+                pool_connections=pool_size,
+                pool_maxsize=pool_size,
+                max_retries=Retry(total=1, backoff_factor=0.2)
+            )
+            _session = requests.Session()
+            _session.mount('http://', adapter)
+            _session.mount('https://', adapter)
+            atexit.register(_session.close)
+        return _session
+
 
 class ValidationService:
     """Validates and enhances scraped business data."""
     
+    def __init__(self):
+        """Initialize validation service."""
+        self._timeout = VALIDATION_CONFIG['website_timeout']
+        self._connect_timeout = VALIDATION_CONFIG['website_connect_timeout']
+        self._country = VALIDATION_CONFIG['default_country_code']
+    
     def validate_phone_number(self, phone: str) -> tuple[str, bool]:
         """
         Validate and format phone number.
@@ -29,28 +235,41 @@ class ValidationService:
         if phone == "N/A":
             return phone, False
         
-        try:
-            digits = extract_digits(phone)
-            parsed_number = phonenumbers.parse(
-                digits,
-                VALIDATION_CONFIG['default_country_code']
-            )
-            
-            if phonenumbers.is_valid_number(parsed_number):
-                formatted = phonenumbers.format_number(
-                    parsed_number,
-                    phonenumbers.PhoneNumberFormat.INTERNATIONAL
-                )
-                return formatted, True
-            else:
-                return phone, False
-        except Exception:
+        digits, number = _normalize_phone(phone)
+        if (not _MIN_PHONE_DIGITS <= len(digits) <= _MAX_PHONE_DIGITS
+                or digits in _PLACEHOLDER_PHONES):
             return phone, False
+        
+        formatted = _format_phone(number, self._country)
+        if formatted is None:
+            return phone, False
+        return formatted, True
+    
+    def validate_phone_numbers(self, phones: List[str]) -> List[tuple[str, bool]]:
+        """
+        Validate and format many phone numbers.
+        
+        Each number goes through validate_phone_number, so batch and
+        single-number results always agree; parsing is memoized on the
+        normalized number, so repeats across the batch are cheap.
+        
+        Args:
+            phones: Raw phone number strings
+            
+        Returns:
+            list: (formatted_phone, is_valid) tuples in input order
+        """
+        return [self.validate_phone_number(phone) for phone in phones]
     
     def validate_website(self, url: str) -> bool:
         """
         Check if website URL is valid and accessible.
         
+        The site root is checked and the result cached per host, since
+        chains and directories often share one domain. Unreachable hosts
+        fail within the short connect timeout; servers that reject HEAD
+        are retried with a streamed GET whose body is never read.
+        
         Args:
             url: Website URL
             
@@ -60,26 +279,42 @@ class ValidationService:
         if url == "N/A":
             return False
         
-        normalized_url = normalize_url(url)
+        host, root_url = _website_root(url)
+        if not _is_plausible_host(host):
+            return False
+        
+        is_valid = _website_cache.get(host)
+        if is_valid is not None:
+            return is_valid
         
+        session = _get_session()
+        request_options = {
+            'timeout': (self._connect_timeout, self._timeout),
+            'headers': _HEADERS[hash(host) % len(_HEADERS)],
+            'allow_redirects': True,
+            'stream': True
+        }
         try:
-            headers = {'User-Agent': random.choice(USER_AGENTS)}
-            response = requests.head(
-                normalized_url,
-                timeout=VALIDATION_CONFIG['website_timeout'],
-                headers=headers,
-                allow_redirects=True
-            )
-            return response.status_code < 400
+            with session.head(root_url, **request_options) as response:
+                status_code = response.status_code
+            if status_code in _HEAD_UNSUPPORTED:
+                with session.get(root_url, **request_options) as response:
+                    status_code = response.status_code
+            is_valid = status_code < 400
         except Exception:
-            return False
+            is_valid = False
+        
+        _website_cache.put(host, is_valid)
+        return is_valid
     
-    def validate_business(self, business_data: Dict) -> Dict:
+    def validate_business(self, business_data: Dict, validate_websites: bool = False) -> Dict:
         """
         Validate all fields of a business.
         
         Args:
             business_data: Raw business data dictionary
+            validate_websites: Issue an HTTP request to check the website.
+                When False, website_valid is left as None (unknown).
             
         Returns:
             dict: Validated business data with validation flags
@@ -90,26 +325,228 @@ class ValidationService:
             business_data.get('phone', 'N/A')
         )
         
-        validated['website_valid'] = self.validate_website(
-            business_data.get('website', 'N/A')
-        )
+        if validate_websites:
+            validated['website_valid'] = self.validate_website(
+                business_data.get('website', 'N/A')
+            )
+        else:
+            validated['website_valid'] = None
         
         return validated
     
-    def validate_batch(self, businesses: List[Dict]) -> List[Dict]:
+    def validate_websites(self, urls: List[str]) -> List[bool]:
+        """
+        Check many websites concurrently.
+        
+        Website checks only wait on the network, so they run on a thread
+        pool of up to VALIDATION_CONFIG['max_workers'] threads. Each host
+        is checked once, like the per-host cache in validate_website.
+        
+        Args:
+            urls: Website URLs ("N/A" for none)
+            
+        Returns:
+            list: Accessibility flags in input order
+        """
+        if not urls:
+            return []
+        
+        from tqdm.contrib.concurrent import thread_map
+        
+        hosts, unique = _group_by_host(urls)
+        
+        host_results = dict(zip(unique, thread_map(
+            self.validate_website,
+            list(unique.values()),
+            max_workers=min(VALIDATION_CONFIG['max_workers'], len(unique)),
+            desc="Checking websites",
+            # No bar when output is not a terminal (CI, log files, MCP server)
+            mininterval=1.0,
+            disable=None
+        )))
+        
+        return [host_results[host] for host in hosts]
+    
+    async def _validate_website_async(self, client, url: str) -> bool:
+        """Async counterpart of validate_website using a shared httpx client."""
+        if url == "N/A":
+            return False
+        
+        host, root_url = _website_root(url)
+        if not _is_plausible_host(host):
+            return False
+        
+        is_valid = _website_cache.get(host)
+        if is_valid is not None:
+            return is_valid
+        
+        headers = _HEADERS[hash(host) % len(_HEADERS)]
+        try:
+            response = await client.head(root_url, headers=headers)
+            status_code = response.status_code
+            if status_code in _HEAD_UNSUPPORTED:
+                async with client.stream('GET', root_url, headers=headers) as response:
+                    status_code = response.status_code
+            is_valid = status_code < 400
+        except Exception:
+            is_valid = False
+        
+        _website_cache.put(host, is_valid)
+        return is_valid
+    
+    async def validate_websites_async(self, urls: List[str]) -> List[bool]:
+        """
+        Check many websites concurrently on the running event loop.
+        
+        Same results as validate_websites, with all checks multiplexed
+        over one httpx.AsyncClient instead of a thread pool, so async
+        callers (like the MCP tools) do not block their loop.
+        
+        Args:
+            urls: Website URLs ("N/A" for none)
+            
+        Returns:
+            list: Accessibility flags in input order
+        """
+        if not urls:
+            return []
+        
+        # Imported lazily: only async callers need httpx
+        import httpx
+        from tqdm.asyncio import tqdm_asyncio
+        
+        hosts, unique = _group_by_host(urls)
+        
+        async with httpx.AsyncClient(
+            timeout=httpx.Timeout(self._timeout, connect=self._connect_timeout),
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=VALIDATION_CONFIG['async_max_connections'])
+        ) as client:
+            results = await tqdm_asyncio.gather(
+                *(self._validate_website_async(client, url) for url in unique.values()),
+                desc="Checking websites",
+                mininterval=1.0,
+                disable=None
+            )
+        
+        host_results = dict(zip(unique, results))
+        return [host_results[host] for host in hosts]
+    
+    def _validate_websites_any(self, urls: List[str]) -> List[bool]:
+        """
+        Check websites with the thread pool or, for large batches, asyncio.
+        
+        Above VALIDATION_CONFIG['async_threshold'] URLs the checks run on a
+        private event loop, which keeps more requests in flight than the
+        thread pool. Inside a running loop (where asyncio.run is not
+        allowed) the thread pool is always used.
+        """
+        if len(urls) > VALIDATION_CONFIG['async_threshold']:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return asyncio.run(self.validate_websites_async(urls))
+        return self.validate_websites(urls)
+    
+    def _validate_phones_deduplicated(self, businesses: List[Dict]) -> List[tuple[str, bool]]:
+        """Validate each distinct phone number once and broadcast the results."""
+        phones = [business.get('phone', 'N/A') for business in businesses]
+        unique_phones = list(dict.fromkeys(phones))
+        phone_lookup = dict(zip(unique_phones, self.validate_phone_numbers(unique_phones)))
+        return [phone_lookup[phone] for phone in phones]
+    
+    @staticmethod
+    def _merge_results(
+        businesses: List[Dict],
+        phone_results: List[tuple[str, bool]],
+        website_results: List[Optional[bool]]
+    ) -> List[Dict]:
+        """Copy businesses with their phone and website validation applied."""
+        return [
+            {**business, 'phone': phone, 'phone_valid': phone_valid, 'website_valid': website_valid}
+            for business, (phone, phone_valid), website_valid
+            in zip(businesses, phone_results, website_results)
+        ]
+    
+    def iter_validated(
+        self,
+        businesses: Iterable[Dict],
+        validate_websites: bool = False
+    ) -> Iterator[Dict]:
+        """
+        Validate businesses as a stream, in input order.
+        
+        Businesses are validated in chunks of
+        VALIDATION_CONFIG['chunk_size'], so only one chunk of validated
+        records is held at a time and consumers (e.g. CSV export) can write
+        them out as they arrive.
+        
+        Args:
+            businesses: Business data dictionaries (any iterable)
+            validate_websites: Issue an HTTP request per website (see validate_business)
+            
+        Yields:
+            dict: Validated business dictionaries
+        """
+        iterator = iter(businesses)
+        while True:
+            chunk = list(islice(iterator, VALIDATION_CONFIG['chunk_size']))
+            if not chunk:
+                return
+            
+            phone_results = self._validate_phones_deduplicated(chunk)
+            
+            if validate_websites:
+                website_results = self._validate_websites_any(
+                    [business.get('website', 'N/A') for business in chunk]
+                )
+            else:
+                website_results = [None] * len(chunk)
+            
+            yield from self._merge_results(chunk, phone_results, website_results)
+    
+    def validate_batch(self, businesses: List[Dict], validate_websites: bool = False) -> List[Dict]:
         """
         Validate a batch of businesses.
         
+        Each distinct phone number is parsed once (see
+        validate_phone_numbers) and websites are checked concurrently
+        (see validate_websites and iter_validated).
+        
         Args:
             businesses: List of business data dictionaries
+            validate_websites: Issue an HTTP request per website (see validate_business)
             
         Returns:
             list: List of validated business dictionaries
         """
-        validated_businesses = []
+        return list(self.iter_validated(businesses, validate_websites))
+    
+    async def validate_batch_async(
+        self,
+        businesses: List[Dict],
+        validate_websites: bool = False
+    ) -> List[Dict]:
+        """
+        Validate a batch of businesses from async code.
+        
+        Same results as validate_batch; website checks run on the event
+        loop (see validate_websites_async).
         
-        for business in tqdm(businesses, desc="Validating data"):
-            validated = self.validate_business(business)
-            validated_businesses.append(validated)
+        Args:
+            businesses: List of business data dictionaries
+            validate_websites: Issue an HTTP request per website (see validate_business)
+            
+        Returns:
+            list: List of validated business dictionaries
+        """
+        phone_results = self._validate_phones_deduplicated(businesses)
+        
+        if validate_websites:
+            website_results = await self.validate_websites_async(
+                [business.get('website', 'N/A') for business in businesses]
+            )
+        else:
+            website_results = [None] * len(businesses)
         
-        return validated_businesses
+        return self._merge_results(businesses, phone_results, website_results)
@@ -69,6 +69,8 @@ def test_state_manager():
     pending = loaded_state.get_pending_urls()
     print(f"✓ Pending URLs: {len(pending)}")
     assert len(pending) == 7
+    assert loaded_state.business_urls == test_urls
+    print("  Business URLs restored from sidecar file")
     
     # Mark completed
     print("✓ Marking session as completed")
@@ -296,6 +298,68 @@ def test_integration():
     print("\n✅ Integration Test PASSED\n")
 
 
+def test_state_log_replay():
+    """Test that progress appended to the state log survives a reload."""
+    print("="*80)
+    print("TEST 4: State Log Replay")
+    print("="*80)
+    
+    state_manager = StateManager()
+    query = "Log Replay Query"
+    max_results = 20
+    state_manager.delete_state(query, max_results)
+    
+    business_urls = [f"https://maps.google.com/place/{i}" for i in range(20)]
+    state = state_manager.create_new_state(
+        query=query,
+        max_results=max_results,
+        output_file="test_log_replay.csv",
+        business_urls=business_urls
+    )
+    
+    # Ten successes and one failure, logged without a snapshot rewrite
+    print("✓ Logging 10 processed and 1 failed URL")
+    for i in range(10):
+        state.mark_processed(i)
+        state_manager.update_state(state)
+    state.mark_failed(10)
+    state_manager.update_state(state)
+    
+    log_file = state_manager._get_log_file_path(state.query_hash)
+    assert log_file.exists()
+    
+    loaded_state = state_manager.load_state(query, max_results)
+    assert loaded_state is not None
+    assert set(loaded_state.processed_indices) == set(range(11))
+    assert loaded_state.successful_count == 10
+    assert loaded_state.failed_count == 1
+    assert loaded_state.last_processed_index == 9
+    print(f"  Replayed {len(loaded_state.processed_indices)} processed URLs from the log")
+    
+    # A full snapshot absorbs the log
+    state_manager.save_state(loaded_state)
+    assert not log_file.exists()
+    assert len(state_manager.load_state(query, max_results).processed_indices) == 11
+    print("  Snapshot absorbed the log")
+    
+    # The exit flush syncs the output file before logging progress
+    checkpoints = []
+    resumed_state = state_manager.load_state(query, max_results)
+    resumed_state.mark_processed(11)
+    state_manager.update_state(
+        resumed_state, save_interval=100, before_flush=lambda: checkpoints.append(True)
+    )
+    state_manager._flush_active_states()
+    assert checkpoints and not resumed_state.pending_events
+    assert 11 in state_manager.load_state(query, max_results).processed_indices
+    print("  Exit flush ran the output checkpoint first")
+    
+    state_manager.delete_state(query, max_results)
+    print("✓ Cleanup completed")
+    
+    print("\n✅ State Log Replay Test PASSED\n")
+
+
 def run_all_tests():
     """Run all tests."""
     print("\n" + "="*80)
@@ -306,6 +370,7 @@ def run_all_tests():
         test_state_manager()
         test_export_service()
         test_integration()
+        test_state_log_replay()
         
         print("="*80)
         print("🎉 ALL TESTS PASSED!")
@@ -12,8 +12,6 @@ project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 from src.services.browser_service import BrowserManager
-from src.services.extraction_service import DataExtractor  # Original
-from src.services.extraction_service_v2 import DataExtractorV2  # Locators
 from src.services.extraction_service_v3 import DataExtractorV3  # URL-based
 from src.utils.logger import get_logger
 
@@ -63,7 +61,9 @@ def test_extractor(extractor_class, solution_name: str, max_results: int = 30):
         results = []
         start_time = time.time()
         
-        def callback(data):
+        def callback(data, index):
+            if data is None:
+                return
             results.append(data)
             print(f"  ✅ [{len(results)}] {data.get('name', 'N/A')[:50]}")
         
@@ -119,19 +119,15 @@ def compare_solutions():
     print("\n" + "="*80)
     print("🔬 EXTRACTION SOLUTIONS COMPARISON TEST")
     print("="*80)
-    print("\nThis test will compare three different extraction approaches:")
-    print("  1. Original (Current implementation with enhancements)")
-    print("  2. Playwright Locators (Modern auto-retrying approach)")
-    print("  3. URL-Based Navigation (Most reliable)")
+    print("\nThis test will run the URL-based extraction approach")
+    print("(the original and locator-based extractors have been removed).")
     print("\nEach solution will extract 30 business listings.")
     print("="*80)
     
     input("\nPress Enter to start testing...")
     
     test_cases = [
-        # (DataExtractor, "Original Implementation"),  # Uncomment to test original
-        (DataExtractorV2, "Solution 1: Playwright Locators (Recommended)"),
-        (DataExtractorV3, "Solution 2: URL-Based Navigation (Most Reliable)"),
+        (DataExtractorV3, "URL-Based Navigation"),
     ]
     
     all_metrics = []
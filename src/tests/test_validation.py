@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Test script for validation and scoring services.
+Runs offline: website checks are disabled so no HTTP requests are made.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.services.validation_service import ValidationService, _group_by_host
+from src.services.scoring_service import LeadScoringService, _score_kernel
+from src.utils.constants import LEAD_SCORING
+
+
+def test_batch_phone_validation():
+    """Batch phone validation should agree with per-number validation."""
+    print("\n" + "="*80)
+    print("TEST 1: Batch Phone Validation")
+    print("="*80)
+
+    validator = ValidationService()
+    phones = [
+        '(206) 555-0123', 'N/A', 'not a phone', '2065550123', ' +1 650-253-0000 ',
+        '+44 20 7946 0958', '+91 98765 43210', '(206) 555-0123 ext. 5'
+    ]
+
+    results = validator.validate_phone_numbers(phones)
+
+    assert len(results) == len(phones)
+    assert results[0] == ('+1 206-555-0123', True)
+    assert results[1] == ('N/A', False)
+    assert results[2] == ('not a phone', False)
+    assert results[3] == ('+1 206-555-0123', True)
+    assert results[4] == ('+1 650-253-0000', True)
+    assert results[5] == ('+44 20 7946 0958', True)
+    assert results[6] == ('+91 98765 43210', True)
+    assert results[7] == ('+1 206-555-0123 ext. 5', True)
+    assert results == [validator.validate_phone_number(phone) for phone in phones]
+    print(f"✓ Validated {len(phones)} phone numbers, matching per-number results")
+
+    # Placeholder numbers are rejected even when they parse as valid
+    assert validator.validate_phone_numbers(['234-567-8910']) == [('234-567-8910', False)]
+    assert validator.validate_phone_number('(123) 456-7890') == ('(123) 456-7890', False)
+    print("✓ Placeholder numbers rejected")
+
+    print("\n✅ Batch Phone Validation Test PASSED\n")
+
+
+def test_validate_batch_without_websites():
+    """Website checks are skipped by default and do not earn the invalid bonus."""
+    print("="*80)
+    print("TEST 2: Validation Without Website Checks")
+    print("="*80)
+
+    validator = ValidationService()
+    scorer = LeadScoringService()
+
+    businesses = [
+        {'name': 'With Site', 'phone': '2065550123', 'website': 'example.com',
+         'rating': 4.0, 'reviews': 50},
+        {'name': 'No Site', 'phone': 'N/A', 'website': 'N/A',
+         'rating': 4.0, 'reviews': 50},
+    ]
+
+    validated = validator.validate_batch(businesses)
+
+    assert validated[0]['website_valid'] is None
+    assert validated[0]['phone_valid'] is True
+    assert validated[1]['phone_valid'] is False
+    print("✓ website_valid left unknown when website checks are disabled")
+
+    assert scorer.calculate_score(validated[0]) == 50
+    assert scorer.calculate_score(validated[1]) == 70
+    print("✓ Unknown website status scores no invalid-website bonus")
+
+    print("\n✅ Validation Without Website Checks Test PASSED\n")
+
+
+def test_score_batch_matches_calculate_score():
+    """Vectorized batch scoring should agree with per-business scoring."""
+    print("="*80)
+    print("TEST 3: Batch Scoring")
+    print("="*80)
+
+    scorer = LeadScoringService()
+
+    businesses = [
+        {'website': 'N/A', 'website_valid': False, 'rating': 4.8, 'reviews': 5},
+        {'website': 'a.com', 'website_valid': True, 'rating': 3.0, 'reviews': 150},
+        {'website': 'b.com', 'website_valid': False, 'rating': '4.5', 'reviews': '100'},
+        {'website': 'c.com', 'website_valid': None, 'rating': None, 'reviews': None},
+        {'website': 'd.com', 'rating': 'N/A', 'reviews': 'N/A'},
+        {'rating': 'bad', 'reviews': '4.5'},
+        {'website': 'N/A', 'rating': 3.4, 'reviews': 9},
+    ]
+
+    expected = [scorer.calculate_score(b) for b in businesses]
+    scored = scorer.score_batch([dict(b) for b in businesses])
+
+    assert [b['lead_score'] for b in scored] == expected
+    assert all(type(b['lead_score']) is int for b in scored)
+    assert scorer.score_batch([]) == []
+    print(f"✓ Batch scores match: {expected}")
+
+    # Compiled kernel logic (runs as plain Python when Numba is missing)
+    kernel = getattr(_score_kernel, 'py_func', _score_kernel)
+    kernel_scores = kernel(
+        np.array([4.8, 3.0, 4.5, np.nan, np.nan, np.nan, 3.4]),
+        np.array([5, 150, 100, np.nan, np.nan, np.nan, 9]),
+        np.array([20, 0, 15, 0, 15, 15, 20]),
+        *(LEAD_SCORING[key] for key in (
+            'base_score', 'max_score',
+            'high_rating_threshold', 'high_rating_bonus', 'low_rating_threshold', 'low_rating_bonus',
+            'high_reviews_threshold', 'high_reviews_bonus', 'low_reviews_threshold', 'low_reviews_bonus'
+        ))
+    )
+    assert kernel_scores.tolist() == expected
+    print("✓ Scoring kernel matches")
+
+    print("\n✅ Batch Scoring Test PASSED\n")
+
+
+def test_iter_validated_streams_in_order():
+    """Streaming validation should match validate_batch across chunk boundaries."""
+    print("="*80)
+    print("TEST 4: Streaming Validation")
+    print("="*80)
+
+    validator = ValidationService()
+    businesses = [{'name': str(i), 'phone': phone} for i, phone in enumerate(
+        ['2065550123', 'N/A', 'x', '6502530000', '2065550123'] * 250
+    )]
+
+    streamed = list(validator.iter_validated(iter(businesses)))
+
+    assert streamed == validator.validate_batch(businesses)
+    assert [b['name'] for b in streamed] == [b['name'] for b in businesses]
+    print(f"✓ Streamed {len(streamed)} businesses in input order")
+
+    # Malformed websites are rejected without a network request
+    assert validator.validate_websites(['null', '', 'N/A', 'http://[bad']) == [False] * 4
+    assert validator.validate_website('http://[bad') is False
+    assert validator.validate_batch(
+        [{'phone': 'N/A', 'website': 'http://[bad'}], validate_websites=True
+    )[0]['website_valid'] is False
+    print("✓ Malformed websites rejected offline")
+
+    # Pages on shared hosts are checked per business, other sites per host
+    _, unique = _group_by_host([
+        'facebook.com/joes', 'https://www.facebook.com/annas', 'example.com/a', 'example.com/b'
+    ])
+    assert len(unique) == 3
+    print("✓ Shared-host pages grouped per business")
+
+    print("\n✅ Streaming Validation Test PASSED\n")
+
+
+if __name__ == "__main__":
+    test_batch_phone_validation()
+    test_validate_batch_without_websites()
+    test_score_batch_matches_calculate_score()
+    test_iter_validated_streams_in_order()
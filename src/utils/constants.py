@@ -30,6 +30,20 @@ HTTP_HEADERS = {
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8"
 }
 
+BROWSER_CONFIG = {
+    'launch_args': ['--disable-dev-shm-usage'],  # Avoid /dev/shm exhaustion in containers
+    'user_data_dir': None,  # Profile directory for a persistent context (None: fresh profile)
+    'blocked_resource_types': {'image', 'media', 'font', 'texttrack', 'manifest'},  # Never needed for extraction
+    'blocked_url_fragments': (  # Ads, analytics and map tiles
+        'googlesyndication.com',
+        'google-analytics.com',
+        'doubleclick.net',
+        'googletagmanager.com',
+        'gstatic.com/maps/tile'
+    ),
+    'retry_backoff_max': 30  # Upper bound in seconds for navigation retry waits
+}
+
 SCROLL_CONFIG = {
     'max_attempts': 50,  # Increased for loading more results
     'pause_time': 2.0,  # Increased pause to let results load
@@ -40,16 +54,44 @@ SCROLL_CONFIG = {
 
 EXTRACTION_CONFIG = {
     'detail_timeout': 10000,
-    'back_timeout': 10000,
+    'field_timeout': 2000,  # Extra wait (ms) for phone/address/website after the name renders
     'min_delay': 1.0,
     'max_delay': 3.0,
     'scroll_delay_min': 0.5,
-    'scroll_delay_max': 1.0
+    'scroll_delay_max': 1.0,
+    'concurrency': 1,  # Pages extracting business details in parallel (opt in with --workers)
+    'http_fast_path': False,  # Try plain HTTP + HTML parsing before the browser
+    'http_timeout': 10,
+    'details_cache_size': 10000,  # Place details remembered for the session
+    'details_cache_ttl': 3600,  # Seconds cached place details are reused
+    'resolve_redirects': False  # Follow website redirects to the final URL (one HEAD per listing)
 }
 
 VALIDATION_CONFIG = {
     'website_timeout': 5,
-    'default_country_code': 'US'
+    'website_connect_timeout': 2,  # Dead hosts fail fast; live ones get website_timeout to answer
+    'default_country_code': 'US',
+    'max_workers': 32,  # Concurrent website checks in validate_batch
+    'chunk_size': 500,  # Businesses validated per step by iter_validated
+    'async_threshold': 100,  # Batches with more websites than this are checked with asyncio
+    'async_max_connections': 100,  # Concurrent website checks on the asyncio path
+    'website_cache_size': 10000,  # Hosts whose check result is remembered
+    'website_cache_ttl': 3600,  # Seconds a website check result stays valid
+    # Hosts serving many businesses' pages; checked and cached per first path segment
+    'shared_hosts': frozenset({
+        'facebook.com', 'm.facebook.com', 'instagram.com', 'linkedin.com', 'twitter.com',
+        'x.com', 'youtube.com', 'tiktok.com', 'linktr.ee', 'sites.google.com'
+    })
+}
+
+EXPORT_CONFIG = {
+    'fsync_interval': 50,  # Force incremental CSV rows to disk every N rows
+    'buffer_size': 1 << 16
+}
+
+CACHE_CONFIG = {
+    'directory': '~/.cache/leadgen',
+    'ttl_seconds': 24 * 60 * 60  # Reuse results for a day
 }
 
 LEAD_SCORING = {
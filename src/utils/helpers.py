@@ -7,6 +7,17 @@ import re
 import time
 from typing import Optional
 
+# Patterns compiled once; these helpers run for every extracted field
+_WHITESPACE_RE = re.compile(r'\s{2,}')
+_NUMBER_RE = re.compile(r'(\d+(?:,\d+)*)')
+_RATING_RE = re.compile(r'(\d+\.\d+)')
+_PLACE_KEY_RE = re.compile(r'!1s(0x[0-9a-fA-F]+:0x[0-9a-fA-F]+)')
+_NON_DIGIT_RE = re.compile(r'\D')
+# Deletes every ASCII character except 0-9
+_ASCII_NON_DIGITS = str.maketrans('', '', ''.join(
+    chr(c) for c in range(128) if not chr(c).isdigit()
+))
+
 
 def add_random_delay(min_seconds: float = 1.0, max_seconds: float = 3.0) -> None:
     """Add a random delay to simulate human behavior."""
@@ -15,12 +26,12 @@ def add_random_delay(min_seconds: float = 1.0, max_seconds: float = 3.0) -> None
 
 def clean_text(text: str) -> str:
     """Clean and normalize text by removing extra whitespace."""
-    return re.sub(r'\s{2,}', ' ', text).strip()
+    return _WHITESPACE_RE.sub(' ', text).strip()
 
 
 def extract_number_from_text(text: str) -> Optional[str]:
     """Extract numeric value from text string."""
-    match = re.search(r'(\d+(?:,\d+)*)', text)
+    match = _NUMBER_RE.search(text)
     if match:
         return match.group(1).replace(',', '')
     return None
@@ -30,7 +41,7 @@ def extract_rating_from_label(aria_label: str) -> Optional[str]:
     """Extract rating value from aria-label text."""
     if not aria_label:
         return None
-    match = re.search(r'(\d+\.\d+)', aria_label)
+    match = _RATING_RE.search(aria_label)
     if match:
         return match.group(1)
     return None
@@ -41,9 +52,20 @@ def encode_search_query(query: str) -> str:
     return query.replace(' ', '+')
 
 
+def extract_place_key(url: str) -> str:
+    """Extract a stable place identifier from a Google Maps place URL."""
+    match = _PLACE_KEY_RE.search(url)
+    if match:
+        return match.group(1)
+    return url.split('?', 1)[0]
+
+
 def extract_digits(text: str) -> str:
     """Extract only digits from text."""
-    return re.sub(r'\D', '', text)
+    if text.isascii():
+        return text.translate(_ASCII_NON_DIGITS)
+    # Other scripts may contain Unicode digits the table does not cover
+    return _NON_DIGIT_RE.sub('', text)
 
 
 def is_valid_url(url: str) -> bool:
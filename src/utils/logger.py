@@ -8,15 +8,24 @@ Writing to stdout corrupts JSON-RPC messages.
 
 import logging
 import sys
+from functools import lru_cache
 from typing import Optional
 
+_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
 
+# Shared by every module logger's handler
+_FORMATTER = logging.Formatter(_LOG_FORMAT, datefmt=_DATE_FORMAT)
+
+
+@lru_cache(maxsize=None)
 def get_logger(name: str, level: str = 'INFO') -> logging.Logger:
     """
     Get a configured logger instance.
     
     CRITICAL: Uses stderr for MCP STDIO compatibility.
     Never use stdout in MCP servers as it corrupts JSON-RPC messages.
+    Loggers are set up once per name; later calls return the cached one.
     
     Args:
         name: Name of the logger (typically __name__)
@@ -30,12 +39,11 @@ def get_logger(name: str, level: str = 'INFO') -> logging.Logger:
     if not logger.handlers:
         # CRITICAL: Use stderr, not stdout for MCP STDIO compatibility
         handler = logging.StreamHandler(sys.stderr)
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        handler.setFormatter(formatter)
+        handler.setFormatter(_FORMATTER)
         logger.addHandler(handler)
+        # The handler above already writes the record; do not repeat it
+        # through the root logger's handlers
+        logger.propagate = False
         
         numeric_level = getattr(logging, level.upper(), logging.INFO)
         logger.setLevel(numeric_level)
@@ -54,7 +62,7 @@ def configure_logging(level: str = 'INFO') -> None:
     
     logging.basicConfig(
         level=numeric_level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S',
-        handlers=[logging.StreamHandler(sys.stdout)]
+        format=_LOG_FORMAT,
+        datefmt=_DATE_FORMAT,
+        handlers=[logging.StreamHandler(sys.stderr)]
     )